@@ -5,7 +5,6 @@
 import re
 from argparse import Namespace
 from logging import getLogger
-from pprint import pformat
 from typing import TYPE_CHECKING, Any
 
 from .approver import Approver
@@ -14,7 +13,7 @@ from .loader.amqp_listener import AMQPListener
 from .loader.qem import get_submission_settings_data
 from .syncres import SyncRes
 from .types.types import Data
-from .utils import compare_submission_data
+from .utils import LazyPformat, compare_submission_data
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -46,12 +45,12 @@ class AMQP(SyncRes):
         if match := build_sub_regex.match(message["BUILD"]):
             sub_type = match.group("type") or settings.default_submission_type
             sub_nr = match.group("id")
-            log.debug("Processing AMQP message: %s", pformat(message))
+            log.debug("Processing AMQP message: %s", LazyPformat(message))
             log.info("Submission %s:%s: openQA job finished", sub_type, sub_nr)
             return self.handle_submission(int(sub_nr), sub_type, message)
         if match := build_agg_regex.match(message["BUILD"]):
             build_nr = match.group(0)
-            log.debug("Processing AMQP message: %s", pformat(message))
+            log.debug("Processing AMQP message: %s", LazyPformat(message))
             log.info("Aggregate %s: openQA build finished", build_nr)
         return None
 
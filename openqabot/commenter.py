@@ -5,7 +5,6 @@
 from __future__ import annotations
 
 from logging import getLogger
-from pprint import pformat
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlencode, urlparse
 
@@ -19,7 +18,7 @@ from .loader.qem import get_aggregate_results, get_submission_results
 from .openqa import OpenQAInterface
 from .osclib.comments import CommentAPI, add_marker, truncate
 from .types.increment import BuildIdentifier
-from .utils import extract_contact_from_description, normalize_results
+from .utils import LazyPformat, extract_contact_from_description, normalize_results
 
 if TYPE_CHECKING:
     from argparse import Namespace
@@ -143,7 +142,7 @@ class Commenter:
             commentapi.add_comment(comment=msg, request_id=request_id)
         else:
             log.info("Dry run: Would write comment to request %s", request_id)
-            log.debug(pformat(msg))
+            log.debug("%s", LazyPformat(msg))
 
     def osc_comment(self, sub: Submission, msg: str, state: str) -> None:
         """Comment a submission in OBS."""
@@ -183,7 +182,7 @@ class Commenter:
 
         if self.dry:
             log.info("Dry run: Would write/update comment to PR %s", sub)
-            log.debug(pformat(msg))
+            log.debug("%s", LazyPformat(msg))
             return
 
         # Unlike OBS (delete + add), Gitea supports PATCH to update in-place,
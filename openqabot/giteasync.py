@@ -4,7 +4,6 @@
 
 from argparse import Namespace
 from logging import getLogger
-from pprint import pformat
 from typing import Any
 
 from openqabot.types.pullrequest import PullRequest
@@ -12,6 +11,7 @@ from openqabot.types.pullrequest import PullRequest
 from .loader.amqp_listener import AMQPListener
 from .loader.gitea import get_open_prs, get_submissions_from_open_prs, make_submission_from_gitea_pr, make_token_header
 from .loader.qem import update_submissions
+from .utils import LazyPformat
 
 log = getLogger("bot.giteasync")
 
@@ -70,7 +70,7 @@ class GiteaSync:
             dry=self.fake_data,
         )
 
-        log.debug("Data for %d submissions: %s", len(submissions), pformat(submissions))
+        log.debug("Data for %d submissions: %s", len(submissions), LazyPformat(submissions))
         if self.dry:
             log.info("Dry run: Would update QEM Dashboard data for %d submissions", len(submissions))
             return 0
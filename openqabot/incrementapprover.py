@@ -13,7 +13,6 @@ from functools import lru_cache
 from itertools import chain, groupby
 from logging import getLogger
 from operator import itemgetter
-from pprint import pformat
 from typing import TYPE_CHECKING, Any
 
 import osc.conf
@@ -32,7 +31,7 @@ from .repodiff import Package, RepoDiff
 from .requests import find_request_on_obs
 from .types.increment import ApprovalStatus, BuildIdentifier, BuildInfo
 from .types.pullrequest import OBSCommentable
-from .utils import merge_dicts, unique_dicts
+from .utils import LazyPformat, merge_dicts, unique_dicts
 
 if TYPE_CHECKING:
     from argparse import Namespace
@@ -150,7 +149,7 @@ class IncrementApprover:
 
         res = [self.client.enrich_stats(stat, job_map) for stat in stats]
 
-        log.debug("Job statistics:\n%s", pformat(res))
+        log.debug("Job statistics:\n%s", LazyPformat(res))
         return res
 
     @staticmethod
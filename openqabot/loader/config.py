@@ -4,13 +4,20 @@
 
 from __future__ import annotations
 
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from logging import getLogger
+from pathlib import Path
+from sys import intern
 from typing import TYPE_CHECKING, Any, Protocol
 
-from ruamel.yaml import YAML, YAMLError
-from ruamel.yaml.constructor import ConstructorError, SafeConstructor
-from ruamel.yaml.nodes import SequenceNode
+import yaml
+from yaml import CSafeLoader, SequenceNode, YAMLError
+from yaml.constructor import ConstructorError
 
+from openqabot import config
 from openqabot.errors import NoTestIssuesError
 from openqabot.types.aggregate import Aggregate
 from openqabot.types.baseconf import JobConfig
@@ -19,16 +26,30 @@ from openqabot.types.types import Data
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterator
-    from pathlib import Path
+
+    from yaml import MappingNode, ScalarNode
+
+
+YAML_SUFFIXES = (".yml", ".yaml")
 
 
 def get_yml_list(path: Path) -> list[Path]:
     """Create a list of YAML filenames from a directory or a single file path."""
-    return [f for ext in ("yml", "yaml") for f in path.glob("*." + ext)] if path.is_dir() else [path]
+    if not path.is_dir():
+        return [path]
+    # a single directory scan, the file type is known from the listing without another stat call
+    with os.scandir(path) as entries:
+        return [Path(e.path) for e in entries if e.name.endswith(YAML_SUFFIXES) and e.is_file()]
 
 
 log = getLogger("bot.loader.config")
 
+PARALLEL_LOAD_THRESHOLD = 4
+# names read without the YAML parser, anything else like numbers or nested items is left to it
+PLAIN_NAME_REGEX = re.compile(r"[A-Za-z_][\w.+-]*")
+# plain names the YAML parser resolves to null or booleans instead of strings
+YAML_RESERVED_NAMES = frozenset({"null", "true", "false", "yes", "no", "on", "off"})
+
 
 class ConfigWithSettings(Protocol):
     """Protocol for configuration objects with settings attribute."""
@@ -38,7 +59,6 @@ class ConfigWithSettings(Protocol):
 
 def _load_one_config[T: ConfigWithSettings](
     file_path: Path,
-    yaml_reader: YAML,
     config_key: str,
     loader_func: Callable[[Any], T],
     *,
@@ -52,7 +72,8 @@ def _load_one_config[T: ConfigWithSettings](
     """
     try:
         log.debug("Loading %s's configuration from '%s'", config_key, file_path)
-        yaml_data = yaml_reader.load(file_path)
+        # shares the files parsed in this process with the metadata and product loaders
+        yaml_data = _parse_yaml(file_path)
         if not yaml_data:
             return
 
@@ -85,18 +106,39 @@ def get_configs_from_path[T: ConfigWithSettings](
     load_defaults: bool = True,
 ) -> list[T]:
     """Load configurations from a file or directory."""
-    yaml_reader = YAML(typ="safe")
     return [
         item
         for file_path in get_yml_list(path)
-        for item in _load_one_config(file_path, yaml_reader, config_key, loader_func, load_defaults=load_defaults)
+        for item in _load_one_config(file_path, config_key, loader_func, load_defaults=load_defaults)
     ]
 
 
-def _try_load(loader: YAML, path: Path) -> dict | None:
+def _parse_yaml(path: Path, *, concat: bool = False) -> Any:  # noqa: ANN401
+    """Parse a YAML file with libyaml, supporting the ``!concat`` tag if ``concat`` is set.
+
+    The same files are loaded for metadata and products, so the parsed content is
+    kept in memory for as long as the file is unchanged.
+    """
+    st = path.stat()
+    return _parse_yaml_cached(str(path), st.st_mtime_ns, st.st_size, concat=concat)
+
+
+@lru_cache(maxsize=1024)
+def _parse_yaml_cached(path: str, _mtime_ns: int, _size: int, *, concat: bool) -> Any:  # noqa: ANN401
+    loader = ConcatSafeLoader if concat else CSafeLoader
+    with Path(path).open("rb") as f:
+        return yaml.load(f, Loader=loader)  # noqa: S506 - both loaders are libyaml safe loaders
+
+
+def clear_cache() -> None:
+    """Clear the YAML files parsed in this process."""
+    _parse_yaml_cached.cache_clear()
+
+
+def _try_load(path: Path, *, concat: bool = False) -> dict | None:
     """Try to load a YAML file and return its content as a dictionary."""
     try:
-        data = loader.load(path)
+        data = _parse_yaml(path, concat=concat)
     except YAMLError:
         log.exception("YAML load failed: File %s", path)
         return None
@@ -112,6 +154,18 @@ def _try_load(loader: YAML, path: Path) -> dict | None:
     return data
 
 
+def _load_all(path: Path, *, concat: bool = False) -> list[tuple[Path, dict]]:
+    """Load all valid YAML files from a directory or a single file path in parallel."""
+    paths = get_yml_list(path)
+    load = partial(_try_load, concat=concat)
+    if len(paths) < PARALLEL_LOAD_THRESHOLD:
+        # a thread pool costs more than it saves for a few files
+        return [(p, data) for p in paths if (data := load(p))]
+    with ThreadPoolExecutor(max_workers=config.settings.max_workers) as executor:
+        loaded = executor.map(load, paths)
+        return [(p, data) for p, data in zip(paths, loaded, strict=True) if data]
+
+
 def _load_one_metadata(
     path: Path,
     data: dict,
@@ -151,18 +205,18 @@ def _load_one_metadata(
                 log.info("Aggregate configuration skipped: Missing 'test_issues' for product %s", product)
 
 
-class ConcatSafeConstructor(SafeConstructor):
-    """Custom YAML constructor with !concat support.
+class ConcatSafeLoader(CSafeLoader):
+    """libyaml safe loader with !concat support.
 
-    Subclasses ``SafeConstructor`` to isolate the ``!concat`` tag from
-    the global namespace. In ``ruamel.yaml``, tag constructors registered via
-    ``add_constructor`` on a class are shared across all loader instances using
-    that class. By design qem-bot only support !concat on the metadata yaml.
-    Subclassing ensure that ``!concat`` is only available for parser used for metadata.
+    Subclasses ``CSafeLoader`` to isolate the ``!concat`` tag from the global
+    namespace. In PyYAML, tag constructors registered via ``add_constructor``
+    on a class are shared across all loaders using that class. By design qem-bot
+    only support !concat on the metadata yaml. Subclassing ensure that
+    ``!concat`` is only available for the loader used for metadata.
     """
 
 
-def concat_constructor(constructor: SafeConstructor, node: SequenceNode) -> Iterator[list[Any]]:
+def concat_constructor(loader: ConcatSafeLoader, node: ScalarNode | SequenceNode | MappingNode) -> Iterator[list[Any]]:
     """Concatenate multiple lists for the YAML !concat tag.
 
     This constructor uses a two-step process to support recursive references
@@ -184,22 +238,15 @@ def concat_constructor(constructor: SafeConstructor, node: SequenceNode) -> Iter
         )
     res: list[Any] = []
     yield res
-    # Unwrapping: takes every item in the !concat and merges them into the res list.
-    for child in node.value:
-        obj = constructor.construct_object(child, deep=True)
-        # ruamel.yaml SafeConstructor returns generators for sequence and
-        # mapping nodes to support recursive references. Resolve them by
-        # calling next(), using __next__ to target these generators while
-        # avoiding accidental consumption of other iterables (like tuples).
-        if not isinstance(obj, (list, dict, str, bytes)) and hasattr(obj, "__next__"):
-            obj = next(iter(obj))
+    # PyYAML fully constructs the items with deep=True, so lists can be merged right away
+    for obj in loader.construct_sequence(node, deep=True):
         if isinstance(obj, list):
             res.extend(obj)
         else:
             res.append(obj)
 
 
-ConcatSafeConstructor.add_constructor("!concat", concat_constructor)
+ConcatSafeLoader.add_constructor("!concat", concat_constructor)
 
 
 def load_metadata(
@@ -210,20 +257,21 @@ def load_metadata(
     extrasettings: set[str],
 ) -> list[Aggregate | Submissions]:
     """Load metadata configurations from a directory of YAML files."""
-    loader = YAML(typ="safe")
-    loader.Constructor = ConcatSafeConstructor
     log.debug("Loading metadata from %s: Submissions=%s, Aggregates=%s", path, not submissions, not aggregate)
 
     return [
         item
-        for p in get_yml_list(path)
-        if (data := _try_load(loader, p))
+        for p, data in _load_all(path, concat=True)
         for item in _load_one_metadata(
             p, data, disable_aggregate=aggregate, disable_submissions=submissions, extrasettings=extrasettings
         )
     ]
 
 
+def _intern(value: Any) -> Any:  # noqa: ANN401 - YAML values are passed on as they are
+    return intern(value) if isinstance(value, str) else value
+
+
 def _parse_product(path: Path, data: dict) -> Iterator[Data]:
     """Parse product information from a configuration dictionary.
 
@@ -239,25 +287,44 @@ def _parse_product(path: Path, data: dict) -> Iterator[Data]:
         log.info("Configuration skipped: File %s missing required setting %s", path, e)
         return
 
-    yield from (Data(0, "aggregate", 0, flavor, arch, distri, version, "", product) for arch in archs)
+    # the same few names are repeated over all product files, so share one string object for each
+    flavor, distri, version, product = map(_intern, (flavor, distri, version, product))
+    yield from (Data(0, "aggregate", 0, flavor, _intern(arch), distri, version, "", product) for arch in archs)
 
 
 def read_products(path: Path) -> list[Data]:
     """Read product definitions from a directory of YAML files."""
     # Intentional: !concat tag is only supported in load_metadata.
-    loader = YAML(typ="safe")
     log.debug("Loading product definitions from %s", path)
 
-    return [item for p in get_yml_list(path) if (data := _try_load(loader, p)) for item in _parse_product(p, data)]
+    return [item for p, data in _load_all(path) for item in _parse_product(p, data)]
+
+
+def _flat_list(text: str) -> set[str] | None:
+    """Read the items of a plain YAML block sequence of names, None for anything else."""
+    items = set()
+    for line in text.splitlines():
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        item = line.removeprefix("- ").strip()
+        # leave quoting, nesting, scalars other than strings and any other YAML syntax to the real parser
+        if line[:2] != "- " or not PLAIN_NAME_REGEX.fullmatch(item) or item.lower() in YAML_RESERVED_NAMES:
+            return None
+        items.add(item)
+    return items
 
 
 def get_onearch(path: Path) -> set[str]:
-    """Read single-architecture package names from a YAML file."""
-    # Intentional: !concat tag is only supported in load_metadata.
-    loader = YAML(typ="safe")
+    """Read single-architecture package names from a YAML file.
 
+    The file is usually a plain list of names, which is read without a YAML parser.
+    """
+    # Intentional: !concat tag is only supported in load_metadata.
     try:
-        data = loader.load(path)
+        text = path.read_text(encoding="utf-8")
+        if (packages := _flat_list(text)) is not None:
+            return packages
+        data = yaml.load(text, Loader=CSafeLoader)
     except (YAMLError, FileNotFoundError):
         return set()
 
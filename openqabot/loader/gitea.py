@@ -18,7 +18,6 @@ from typing import TYPE_CHECKING, Any, cast
 
 import osc.conf
 import osc.core
-import osc.util.xml
 import requests
 from lxml import etree  # ty: ignore[unresolved-import]
 from osc.connection import http_GET
@@ -29,7 +28,8 @@ from openqabot.types.pullrequest import PullRequest
 from openqabot.utils import retry10 as retried_requests
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
+    from typing import IO
 
     from openqabot.types.types import Repos
 
@@ -42,13 +42,21 @@ log = getLogger("bot.loader.gitea")
 
 @dataclass
 class BuildResults:
-    """Results of a build."""
+    """Results of a build.
+
+    The OBS products setting is read once when the results are created, not for every build result.
+    """
 
     projects: set[str] = field(default_factory=set)
     successful: set[str] = field(default_factory=set)
     unpublished: set[str] = field(default_factory=set)
     failed: set[str] = field(default_factory=set)
     unavailable: set[str] = field(default_factory=set)
+    products: set[str] = field(default_factory=lambda: config.settings.obs_products_set)
+
+    def considers(self, product: str) -> bool:
+        """Check if the build results of a product are considered according to the OBS products setting."""
+        return "all" in self.products or product in self.products
 
 
 PROJECT_PRODUCT_REGEX = re.compile(r".*:PullRequest:\d+:(.*)")
@@ -57,7 +65,8 @@ VERSION_EXTRACT_REGEX = re.compile(r"[.\d]+")
 OBS_PROJECT_SHOW_REGEX = re.compile(r".*/project/show/([^/\s\?\#\)]+)")
 # Regex to find all HTTPS URLs, excluding common trailing punctuation like dots or parentheses
 # that are likely part of the surrounding text (e.g. at the end of a sentence or in Markdown).
-URL_FINDALL_REGEX = re.compile(r"https?://[^\s\?\#\)]*[^\s\?\#\)\.]")
+# Possessive quantifiers keep the scan linear as dots never need to be given back.
+URL_FINDALL_REGEX = re.compile(r"https?://(?:\.*+[^\s\?\#\)\.])++")
 
 
 def make_token_header(token: str) -> dict[str, str]:
@@ -178,8 +187,12 @@ def review_url(repo_name: str, number: int, review_id: int) -> str:
     return f"repos/{repo_name}/pulls/{number}/reviews/{review_id}"
 
 
+@lru_cache(maxsize=1024)
 def get_product_name(obs_project: str) -> str:
-    """Extract product name from an OBS project name."""
+    """Extract product name from an OBS project name.
+
+    This is done for every build result and SLFO channel, which mostly share a few projects.
+    """
     product_match = PROJECT_PRODUCT_REGEX.search(obs_project)
     return product_match.group(1) if product_match else ""
 
@@ -377,7 +390,7 @@ def get_product_version_from_repo_listing(project: str, product_name: str, repos
     return next((v for v in versions if len(v) > 0), "")
 
 
-def _get_product_version(res: etree._Element, project: str, product_name: str) -> str:
+def _get_product_version(res: etree._Element, project: str, product_name: str, *, considered: bool) -> str:
     """Extract product version from scmsync element or repository listing."""
     # read product version from scmsync element if possible, e.g. 15.99
     product_version = ""
@@ -388,11 +401,7 @@ def _get_product_version(res: etree._Element, project: str, product_name: str) -
             break
 
     # read product version from directory listing if the project is for a concrete product
-    if (
-        len(product_name) != 0
-        and len(product_version) == 0
-        and ("all" in config.settings.obs_products_set or product_name in config.settings.obs_products_set)
-    ):
+    if len(product_name) != 0 and len(product_version) == 0 and considered:
         product_version = get_product_version_from_repo_listing(project, product_name, res.get("repository"))
 
     return product_version
@@ -403,14 +412,14 @@ def add_channel_for_build_result(
     arch: str,
     product_name: str,
     res: etree._Element,
-    projects: set[str],
+    results: BuildResults,
 ) -> str:
-    """Construct a channel string for a build result and add it to the project set."""
+    """Construct a channel string for a build result and add it to the projects of the results."""
     channel = f"{project}:{arch}"
     if arch == "local":
         return channel
 
-    product_version = _get_product_version(res, project, product_name)
+    product_version = _get_product_version(res, project, product_name, considered=results.considers(product_name))
 
     # append product version to channel if known; otherwise skip channel if this is for a concrete product
     if len(product_version) > 0:
@@ -419,7 +428,7 @@ def add_channel_for_build_result(
         log.debug("Channel skipped: Product version for build result %s:%s could not be determined", project, arch)
         return channel
 
-    projects.add(channel)
+    results.projects.add(channel)
     return channel
 
 
@@ -455,9 +464,9 @@ def add_build_result(
 
     _update_scminfo(submission, res, project, product)
 
-    channel = add_channel_for_build_result(project, res.get("arch"), product, res, results.projects)
+    channel = add_channel_for_build_result(project, res.get("arch"), product, res, results)
 
-    if "all" not in config.settings.obs_products_set and product not in config.settings.obs_products_set:
+    if not results.considers(product):
         return
 
     if res.get("state") != "published":
@@ -506,29 +515,42 @@ def determine_relevant_archs_from_multibuild_info(obs_project: str, *, dry: bool
 
 def is_build_result_relevant(res: etree._Element, relevant_archs: set[str] | None) -> bool:
     """Check if a build result is relevant for the current product and architecture."""
-    if config.settings.obs_repo_type and res.get("repository") != config.settings.obs_repo_type:
-        log.debug(
-            "Build result %s:%s ignored (obs_repo_type='%s')",
-            res.get("project"),
-            res.get("repository"),
-            config.settings.obs_repo_type,
-        )
+    repo_type = config.settings.obs_repo_type
+    if repo_type and (repository := res.get("repository")) != repo_type:
+        log.debug("Build result %s:%s ignored (obs_repo_type='%s')", res.get("project"), repository, repo_type)
         return False
-    arch = res.get("arch")
-    return arch == "local" or relevant_archs is None or arch in relevant_archs
+    return relevant_archs is None or (arch := res.get("arch")) == "local" or arch in relevant_archs
+
+
+def _iter_results(stream: IO[bytes]) -> Iterator[etree._Element]:
+    """Stream the result elements of a build results document.
 
+    Every result is dropped from the tree once it has been processed, so large
+    documents are read with constant memory.
 
-def _get_project_results(obs_project: str, *, dry: bool, results: BuildResults) -> list[etree._Element]:
-    """Fetch build results for an OBS project."""
+    Yields:
+        The result elements in document order.
+
+    """
+    for _, res in etree.iterparse(stream, tag="result"):
+        yield res
+        res.clear()
+        while res.getprevious() is not None:
+            del res.getparent()[0]
+
+
+def _get_project_results(obs_project: str, *, dry: bool, results: BuildResults) -> Iterable[etree._Element] | None:
+    """Fetch build results for an OBS project, None if they are unavailable."""
     build_info_url = osc.core.makeurl(config.settings.obs_url, ["build", obs_project, "_result"])
     if dry:
         return read_xml("build-results-124-" + obs_project).getroot().findall("result")
     try:
-        return osc.util.xml.xml_parse(http_GET(build_info_url)).getroot().findall("result")
+        response = http_GET(build_info_url)
     except urllib.error.HTTPError:
         results.unavailable.add(obs_project)
         log.info("Build results for project %s unreadable, skipping: %s", obs_project, build_info_url)
-        return []
+        return None
+    return _iter_results(response)
 
 
 def _process_obs_url(
@@ -543,9 +565,14 @@ def _process_obs_url(
         return
     obs_project = project_match.group(1)
     log.debug("Checking OBS project %s", obs_project)
+    project_results = _get_project_results(obs_project, dry=dry, results=results)
+    # only look up the multibuild info of projects whose build results are readable
+    if project_results is None:
+        return
     relevant_archs = determine_relevant_archs_from_multibuild_info(obs_project, dry=dry)
 
-    for res in _get_project_results(obs_project, dry=dry, results=results):
+    # filter on repository and architecture before any channel or status work is done
+    for res in project_results:
         if is_build_result_relevant(res, relevant_archs):
             add_build_result(submission, res, results)
 
@@ -572,13 +599,11 @@ def add_build_results(submission: dict[str, Any], obs_urls: list[str], *, dry: b
     })
 
     channels = submission.setdefault("channels", [])
-    channels.extend(result for result in sorted(results.projects) if result not in channels)
+    channels.extend(sorted(results.projects.difference(channels)))
 
-    if "scminfo" not in submission and (
-        len(config.settings.obs_products_set),
-        "all" in config.settings.obs_products_set,
-    ) == (1, False):
-        submission["scminfo"] = submission.get("scminfo_" + next(iter(config.settings.obs_products_set)), "")
+    products = results.products
+    if "scminfo" not in submission and (len(products), "all" in products) == (1, False):
+        submission["scminfo"] = submission.get("scminfo_" + next(iter(products)), "")
 
 
 def add_comments_and_referenced_build_results(
@@ -588,22 +613,20 @@ def add_comments_and_referenced_build_results(
     dry: bool,
 ) -> None:
     """Find and process build result URLs from bot comments on a PR."""
-    bot_comments = [
-        comment for comment in comments if comment["user"]["username"] == config.settings.git_obs_staging_bot_user
-    ]
+    # PRs can have long discussions, so look up the setting and the regex only once
+    bot_user = config.settings.git_obs_staging_bot_user
+    findall = URL_FINDALL_REGEX.findall
+    bot_comments = [comment["body"] for comment in comments if comment["user"]["username"] == bot_user]
     if not bot_comments:
         return
 
-    obs_urls = {url for comment in bot_comments for url in URL_FINDALL_REGEX.findall(comment["body"])}
+    # most comments carry no link at all, a substring check is much cheaper than running the regex
+    obs_urls = {url for body in bot_comments if "://" in body for url in findall(body)}
 
     if obs_urls:
         add_build_results(submission, sorted(obs_urls), dry=dry)
     else:
-        log.warning(
-            "PR git:%s: No OBS URLs found in comments from %s",
-            submission["number"],
-            config.settings.git_obs_staging_bot_user,
-        )
+        log.warning("PR git:%s: No OBS URLs found in comments from %s", submission["number"], bot_user)
 
 
 def add_packages_from_patchinfo(
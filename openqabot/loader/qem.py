@@ -9,7 +9,6 @@ from http import HTTPStatus
 from itertools import chain
 from logging import getLogger
 from operator import itemgetter
-from pprint import pformat
 from typing import TYPE_CHECKING, Any, NamedTuple
 
 import requests
@@ -19,6 +18,7 @@ from openqabot import config, dashboard
 from openqabot.errors import NoResultsError
 from openqabot.types.submission import Submission
 from openqabot.types.types import Data
+from openqabot.utils import LazyPformat
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -244,7 +244,7 @@ def get_aggregate_settings_data(data: Data) -> Sequence[Data]:
         log.info("No aggregate settings found for product %s on arch %s", data.product, data.arch)
         return []
 
-    log.debug("Resolving aggregate ID for data: %s", pformat(data))
+    log.debug("Resolving aggregate ID for data: %s", LazyPformat(data))
 
     # use last three schedule
     return [data._replace(settings_id=s["id"], build=s["build"]) for s in settings[:3]]
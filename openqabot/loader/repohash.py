@@ -4,7 +4,10 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import md5
+from io import BytesIO
+from itertools import chain
 from logging import getLogger
 from typing import TYPE_CHECKING, NamedTuple
 
@@ -19,11 +22,14 @@ from openqabot.utils import retry5 as retried_requests
 from . import gitea
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Mapping, Sequence
 
-    from openqabot.types.types import Repos
+    from openqabot.types.types import ArchVer, Repos
 
 log = getLogger("bot.loader.repohash")
+REVISION_TAG = "{http://linux.duke.edu/metadata/repo}revision"
+
+_REVISIONS_CACHE: dict[str, int | None] = {}
 
 
 class RepoOptions(NamedTuple):
@@ -34,33 +40,27 @@ class RepoOptions(NamedTuple):
     submission_id: str | None = None
 
 
-def get_max_revision(
-    repos: Sequence[Repos],
-    arch: str,
-    project: str,
-    options: RepoOptions | None = None,
-) -> int:
-    """Calculate the maximum repository revision for a submission."""
-    max_rev = 0
-    options = options or RepoOptions()
-    sub_msg = (
-        f"Submission {options.submission_id} skipped"
-        if options.submission_id
-        else f"Submission for project {project} skipped"
-    )
-
-    for repo in repos:
-        product_name = options.product_name or gitea.get_product_name(repo.version)
-        product_version = options.product_version or repo.product_version
-        repo_with_opts = repo._replace(product_version=product_version)
-        url = repo_with_opts.compute_url(config.settings.obs_download_url, product_name, arch, project=project)
-        log.debug("Computing RepoHash for %s from %s", repo.version, url)
+def _repo_url(repo: Repos, arch: str, project: str, options: RepoOptions) -> str:
+    product_name = options.product_name or gitea.get_product_name(repo.version)
+    product_version = options.product_version or repo.product_version
+    repo_with_opts = repo._replace(product_version=product_version)
+    url = repo_with_opts.compute_url(config.settings.obs_download_url, product_name, arch, project=project)
+    log.debug("Computing RepoHash for %s from %s", repo.version, url)
+    return url
+
+
+def _skip_message(project: str, options: RepoOptions) -> str:
+    if options.submission_id:
+        return f"Submission {options.submission_id} skipped"
+    return f"Submission for project {project} skipped"
 
+
+def _max_revision(urls: list[str], revisions: Iterator[tuple[bool, int | None]], sub_msg: str) -> int:
+    """Reduce the revisions fetched for ``urls``, taking them from ``revisions`` in the same order."""
+    max_rev = 0
+    for url in urls:
         try:
-            req = retried_requests.get(url)
-            if req.ok:
-                root = etree.fromstring(req.content)
-                cs = root.find(".//{http://linux.duke.edu/metadata/repo}revision")
+            ok, revision = next(revisions)
         except (
             etree.ParseError,
             requests.ConnectionError,
@@ -70,18 +70,73 @@ def get_max_revision(
             log.info("%s: RepoHash metadata not found at %s", sub_msg, url)
             raise NoRepoFoundError from e
 
-        if not req.ok:
+        if not ok:
             log.info("Submission skipped: RepoHash metadata not found at %s", url)
             continue
 
-        if cs is None:
+        if revision is None:
             log.info("%s: RepoHash calculation failed, no revision tag found in %s", sub_msg, url)
             raise NoRepoFoundError
-        max_rev = max(max_rev, int(str(cs.text)))
+        max_rev = max(max_rev, revision)
 
     return max_rev
 
 
+def get_max_revisions(
+    repos_by_archver: Mapping[ArchVer, Sequence[Repos]],
+    project: str,
+    options: RepoOptions | None = None,
+    *,
+    concurrent: bool = True,
+) -> dict[ArchVer, int]:
+    """Calculate the maximum repository revision for each architecture and version of a submission.
+
+    The repository metadata of all groups is fetched concurrently in a single batch,
+    or one after the other if the caller already runs this in a thread pool.
+    """
+    options = options or RepoOptions()
+    urls = {
+        archver: [_repo_url(repo, archver.arch, project, options) for repo in repos]
+        for archver, repos in repos_by_archver.items()
+    }
+    sub_msg = _skip_message(project, options)
+    all_urls = chain.from_iterable(urls.values())
+
+    if not concurrent:
+        revisions = map(_fetch_revision, all_urls)
+        return {archver: _max_revision(group, revisions, sub_msg) for archver, group in urls.items()}
+    with ThreadPoolExecutor(max_workers=config.settings.max_workers) as executor:
+        revisions = executor.map(_fetch_revision, all_urls)
+        return {archver: _max_revision(group, revisions, sub_msg) for archver, group in urls.items()}
+
+
+def _fetch_revision(url: str) -> tuple[bool, int | None]:
+    """Fetch the revision from the repomd.xml at the given URL.
+
+    The same repository is shared by many submissions so the revisions read
+    from published metadata are cached for the lifetime of the process.
+    Failed or unsuccessful requests are not cached and are tried again.
+    """
+    if url in _REVISIONS_CACHE:
+        return True, _REVISIONS_CACHE[url]
+    req = retried_requests.get(url)
+    if not req.ok:
+        return False, None
+    # stream the document and stop at the first revision instead of building the whole tree
+    revisions = (elem.text for _, elem in etree.iterparse(BytesIO(req.content), tag=REVISION_TAG))
+    revision = next(revisions, None)
+    _REVISIONS_CACHE[url] = None if revision is None else int(revision)
+    return True, _REVISIONS_CACHE[url]
+
+
+def clear_cache() -> None:
+    """Clear the cached repository revisions."""
+    _REVISIONS_CACHE.clear()
+
+
 def merge_repohash(hashes: list[str]) -> str:
     """Merge multiple repohashes into a single MD5 hash."""
-    return md5(b"start" + "".join(hashes).encode(), usedforsecurity=False).hexdigest()
+    merged = md5(b"start", usedforsecurity=False)
+    for h in hashes:
+        merged.update(h.encode())
+    return merged.hexdigest()
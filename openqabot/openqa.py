@@ -18,7 +18,7 @@ from openqa_client.exceptions import RequestError
 
 import openqabot.config as config_module
 from openqabot import config
-from openqabot.utils import number_of_retries
+from openqabot.utils import LazyPformat, number_of_retries
 
 from .errors import JobNotFoundError, PostOpenQAError
 from .loader.qem import update_job
@@ -83,7 +83,7 @@ class OpenQAInterface:
 
     def get_jobs(self, data: Data) -> list[dict[str, Any]]:
         """Fetch openQA jobs matching the given criteria."""
-        log.debug("Fetching openQA jobs for %s", pformat(data))
+        log.debug("Fetching openQA jobs for %s", LazyPformat(data))
         param = {
             "scope": "relevant",
             "latest": "1",
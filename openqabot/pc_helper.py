@@ -8,7 +8,6 @@ import json
 import re
 from functools import cache
 from logging import getLogger
-from operator import itemgetter
 from typing import Any
 
 import requests
@@ -26,13 +25,23 @@ def get_latest_tools_image(query: str) -> str | None:
     a value for <BUILD NUM>
     """
     # Get the first not-failing item
-    build_results = retried_requests.get(query).json()["build_results"]
+    build_results = tools_image_query(query)["build_results"]
     return next(
         ("publiccloud_tools_{}.qcow2".format(build["build"]) for build in build_results if build["failed"] == 0),
         None,
     )
 
 
+@cache
+def tools_image_query(query: str) -> dict[str, Any]:
+    """Perform a tools image query.
+
+    The same query is applied to every flavor, architecture and submission,
+    so successive queries are cached like the pint ones.
+    """
+    return retried_requests.get(query).json()
+
+
 def apply_pc_tools_image(settings: dict[str, Any]) -> dict[str, Any]:
     """Apply the PC tools image in settings.
 
@@ -124,16 +133,15 @@ def get_recent_pint_image(
     # Apply selection criteria: state and region criteria can be omitted by setting the corresponding variable to None
     # This is required, because certain public cloud providers do not make a distinction on e.g. the region and thus
     # this check is not needed there
-    filtered_images = [
+    # Cheap dictionary lookups go first so the regular expression only runs on the remaining candidates
+    filtered_images = (
         image
         for image in images
-        if name.match(image["name"]) is not None
-        and (state is None or image["state"] == state)
-        and (region is None or not region or region == image["region"])
-    ]
-    if not filtered_images:
-        return None
-    return max(filtered_images, key=itemgetter("publishedon"))
+        if (state is None or image["state"] == state)
+        and (not region or region == image["region"])
+        and name.match(image["name"]) is not None
+    )
+    return max(filtered_images, key=lambda image: int(image["publishedon"]), default=None)
 
 
 def apply_public_cloud_settings(settings: dict[str, Any]) -> dict[str, Any] | None:
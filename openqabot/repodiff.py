@@ -32,6 +32,7 @@ name_tag = ns + "name"
 version_tag = ns + "version"
 arch_tag = ns + "arch"
 primary_re = re.compile(r".*-primary.xml(?:.(gz|zst))?$")
+initial_version_re = re.compile(r"1(?:\..*)?")
 
 
 class Package(NamedTuple):
@@ -46,7 +47,7 @@ class Package(NamedTuple):
     @property
     def is_initial_version(self) -> bool:
         """Check if package is an initial version."""
-        return bool(self.version and re.match(r"^1(?:\..*)?$", self.version))
+        return bool(self.version and initial_version_re.fullmatch(self.version))
 
     @property
     def is_placeholder(self) -> bool:
@@ -6,12 +6,12 @@ from __future__ import annotations
 
 from logging import getLogger
 from operator import itemgetter
-from pprint import pformat
 from typing import TYPE_CHECKING, Any
 
 from .config import settings
 from .loader.qem import update_submissions
 from .loader.smelt import get_active_submission_ids, get_submissions
+from .utils import LazyPformat
 
 if TYPE_CHECKING:
     from argparse import Namespace
@@ -34,7 +34,7 @@ class SMELTSync:
 
         data = self.create_list(self.submissions)
         log.info("Updating %d submissions on QEM Dashboard", len(data))
-        log.debug("Data: %s", pformat(data))
+        log.debug("Data: %s", LazyPformat(data))
 
         if self.dry:
             log.info("Dry run: Skipping dashboard update")
@@ -5,13 +5,12 @@
 from __future__ import annotations
 
 from logging import getLogger
-from pprint import pformat
 from typing import TYPE_CHECKING, Any
 
 from .config import settings
 from .loader.qem import post_job
 from .openqa import OpenQAInterface
-from .utils import normalize_results
+from .utils import LazyPformat, normalize_results
 
 if TYPE_CHECKING:
     from argparse import Namespace
@@ -92,7 +91,7 @@ class SyncRes:
             sub_id,
             result["status"],
         )
-        log.debug("Full post data: %s", pformat(result))
+        log.debug("Full post data: %s", LazyPformat(result))
         if self.dry:
             log.debug("Dry run: Skipping dashboard update")
             return
@@ -76,7 +76,7 @@ class Aggregate(BaseConf):
         """Filter out submissions that are not suitable for aggregate tests."""
 
         def is_valid(submission: Submission) -> bool:
-            if any((submission.livepatch, submission.staging)):
+            if submission.livepatch or submission.staging:
                 return False
             if self.filter_embargoed(self.flavor) and submission.embargoed:
                 log.debug("Submission %s skipped: Embargoed and embargo-filtering enabled", submission)
@@ -154,20 +154,20 @@ class Aggregate(BaseConf):
         ci_url: str | None,
     ) -> dict[str, Any] | None:
         """Create the full post data for the dashboard."""
-        openqa_data: dict[str, Any] = {"REPOHASH": data.repohash, "BUILD": data.build}
-        full_post: dict[str, Any] = {
-            "openqa": openqa_data,
-            "qem": {"incidents": [], "settings": {}},
-            "api": "api/update_settings",
-        }
-        if ci_url:
-            full_post["openqa"]["__CI_JOB_URL"] = ci_url
-
         settings_data = apply_public_cloud_settings(self.settings.copy())
         if settings_data is None:
             return None
 
-        full_post["openqa"].update(settings_data)
+        # post the copy of the settings itself, the product settings still take precedence
+        settings_data.setdefault("REPOHASH", data.repohash)
+        settings_data.setdefault("BUILD", data.build)
+        if ci_url:
+            settings_data.setdefault("__CI_JOB_URL", ci_url)
+        full_post: dict[str, Any] = {
+            "openqa": settings_data,
+            "qem": {"incidents": [], "settings": {}},
+            "api": "api/update_settings",
+        }
         full_post["openqa"]["FLAVOR"] = self.flavor
         full_post["openqa"]["ARCH"] = arch
         full_post["openqa"]["_DEPRIORITIZEBUILD"] = 1
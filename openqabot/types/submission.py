@@ -6,13 +6,14 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
+from functools import lru_cache
 from logging import getLogger
 from typing import Any
 
 from openqabot import config
 from openqabot.errors import EmptyChannelsError, EmptyPackagesError, NoRepoFoundError
 from openqabot.loader import gitea
-from openqabot.loader.repohash import RepoOptions, get_max_revision
+from openqabot.loader.repohash import RepoOptions, get_max_revisions
 
 from .types import ArchVer, ChannelType, Repos, get_channel_type
 
@@ -21,6 +22,37 @@ version_pattern = re.compile(r"(\d+(?:[.-](?:SP)?\d+)?)")
 
 EXPECTED_PART_LENGTH_WITH_ARCH = 3
 EXPECTED_PART_LENGTH_NO_ARCH = 2
+KERNEL_PACKAGE_PREFIXES = ("kernel-default", "kernel-source", "kernel-azure")
+LIVEPATCH_PACKAGE_PREFIXES = ("kgraft-patch-", "kernel-livepatch")
+
+
+@lru_cache(maxsize=1024)
+def _strip_version(version: str) -> str:
+    """Reduce a channel version like '15-SP4-LTSS' to its numeric part, e.g. '15-SP4'."""
+    v = version_pattern.match(version)
+    return v.group(0) if v else version
+
+
+@lru_cache(maxsize=4096)
+def _parse_update_channel(channel: str) -> tuple[bool, Repos | None]:
+    """Parse a 'SUSE:Updates:<product>:<version>[:<arch>]' channel.
+
+    Return whether the channel names an architecture along with the repository,
+    which is None for unusable channels. The same channels are shared by many
+    submissions so the result is cached.
+    """
+    val = channel.split(":")[2:]
+    if len(val) == EXPECTED_PART_LENGTH_WITH_ARCH:
+        product, version, arch = val
+        if product == "SLE-Module-Development-Tools-OBS" or (
+            # there is no Manager-Server on aarch64
+            product == "SLE-Module-SUSE-Manager-Server" and arch == "aarch64"
+        ):
+            return True, None
+        return True, Repos(product, version, arch)
+    if len(val) == EXPECTED_PART_LENGTH_NO_ARCH:
+        return False, Repos(val[0], val[1], "x86_64")
+    return False, None
 
 
 class Submission:
@@ -39,7 +71,7 @@ class Submission:
         self.type: str = submission.get("type") or config.settings.default_submission_type
         self.url: str | None = submission.get("url")
 
-        self._initialize_channels([item for item in submission.get("channels") or [] if item])
+        self._initialize_channels(submission.get("channels") or [])
         self._validate_channels()
         self._initialize_packages([item for item in submission.get("packages") or [] if item])
         self.emu: bool = submission["emu"]
@@ -47,8 +79,20 @@ class Submission:
         self.rev_cache_params: tuple[Any, ...] | None = None
         self.rev_logged: bool = False
         self._logged_skipped: bool = False
+        self._contains_package: dict[tuple[str, ...], bool] = {}
         self.livepatch: bool = self.is_livepatch(self.packages)
 
+    @property
+    def channels(self) -> list[Repos]:
+        """Channels of the submission in their original order."""
+        return self._channels
+
+    @channels.setter
+    def channels(self, channels: list[Repos]) -> None:
+        self._channels = channels
+        # channels are looked up for every flavor and architecture, so keep a set for that
+        self.channels_set: frozenset[Repos] = frozenset(channels)
+
     @property
     def is_gitea(self) -> bool:
         """Check if the submission is from Gitea."""
@@ -60,7 +104,7 @@ class Submission:
             return f"[![{label}]({image_url})]({url})"
         return f"[{label}]({url})"
 
-    def _initialize_channels(self, raw_channels: list[str]) -> None:
+    def _initialize_channels(self, raw_channels: list[str | None]) -> None:
         """Initialize channels and skipped products from raw channel data."""
         self.channels, self.skipped_products = self._parse_channels(raw_channels)
 
@@ -76,35 +120,29 @@ class Submission:
             raise EmptyPackagesError(self.project)
 
     @staticmethod
-    def _parse_channels(raw_channels: list[str]) -> tuple[list[Repos], set[str]]:
+    def _parse_channels(raw_channels: list[str | None]) -> tuple[list[Repos], set[str]]:
         updates_3, updates_2, slfo = [], [], []
         skipped = set()
+        # the setting is split on every access, so only do it once per submission
+        products = config.settings.obs_products_set
 
-        for r in raw_channels:
+        # classify every channel in a single pass, ignoring null entries on the fly
+        for r in filter(None, raw_channels):
             if r.startswith("SUSE:Updates"):
-                val = r.split(":")[2:]
-                if len(val) == EXPECTED_PART_LENGTH_WITH_ARCH and val[0] != "SLE-Module-Development-Tools-OBS":
-                    updates_3.append(Repos(val[0], val[1], val[2]))
-                elif len(val) == EXPECTED_PART_LENGTH_NO_ARCH:
-                    updates_2.append(Repos(val[0], val[1], "x86_64"))
+                with_arch, repo = _parse_update_channel(r)
+                if repo:
+                    (updates_3 if with_arch else updates_2).append(repo)
             elif r.startswith("SUSE:SLFO"):
                 val = r.split(":")
                 if len(val) > EXPECTED_PART_LENGTH_WITH_ARCH:
                     obs_project = ":".join(val[2:-1])
                     product = gitea.get_product_name(obs_project)
-                    if "all" in config.settings.obs_products_set or product in config.settings.obs_products_set:
+                    if "all" in products or product in products:
                         slfo.append(Repos(":".join(val[0:2]), obs_project, *(val[-1].split("#"))))
                     else:
                         skipped.add(product)
 
-        # remove Manager-Server on aarch64 from channels
-        filtered_channels = [
-            chan
-            for chan in (updates_3 + updates_2 + slfo)
-            if not (chan.product == "SLE-Module-SUSE-Manager-Server" and chan.arch == "aarch64")
-        ]
-
-        return filtered_channels, skipped
+        return [*updates_3, *updates_2, *slfo], skipped
 
     def log_skipped(self) -> None:
         """Log products that were skipped during channel initialization."""
@@ -132,8 +170,14 @@ class Submission:
         product_repo: list[str] | str | None,
         product_version: str | None,
         limit_archs: set[str] | None = None,
+        *,
+        concurrent: bool = True,
     ) -> bool:
-        """Calculate repohashes for all channels of this submission."""
+        """Calculate repohashes for all channels of this submission.
+
+        Callers already fetching several submissions in a thread pool pass
+        concurrent=False to fetch the repositories of each one serially.
+        """
         params = (product_repo, product_version, frozenset(limit_archs) if limit_archs else None)
         if self.rev_cache_params == params:
             return self.revisions is not None
@@ -148,6 +192,7 @@ class Submission:
                 self.project,
                 opts,
                 limit_archs,
+                concurrent=concurrent,
             )
         except NoRepoFoundError as e:
             if not self.rev_logged:
@@ -186,11 +231,7 @@ class Submission:
         for repo in channels:
             if limit_archs and repo.arch not in limit_archs:
                 continue
-            version = repo.version
-            if v := re.match(version_pattern, repo.version):
-                version = v.group(0)
-
-            ver = repo.product_version or version
+            ver = repo.product_version or _strip_version(repo.version)
 
             if options.product_version and ver != options.product_version:
                 continue
@@ -204,25 +245,31 @@ class Submission:
         project: str,
         options: RepoOptions,
         limit_archs: set[str] | None = None,
+        *,
+        concurrent: bool = True,
     ) -> dict[ArchVer, int]:
         """Calculate repohashes for a set of channels."""
-        rev: dict[ArchVer, int] = {}
         tmpdict = Submission._group_repos_by_archver(channels, options, limit_archs)
+        filter_product = get_channel_type(project) == ChannelType.SLFO and options.product_name
 
+        repos_by_archver: dict[ArchVer, list[Repos]] = {}
         for archver, lrepos in tmpdict.items():
             repos_to_check = lrepos
-            if get_channel_type(project) == ChannelType.SLFO and options.product_name:
+            if filter_product:
                 filtered_repos = [
                     r for r in lrepos if options.product_name.startswith(gitea.get_product_name(r.version))
                 ]
                 if not filtered_repos:
                     continue
                 repos_to_check = filtered_repos
-
-            max_rev = get_max_revision(repos_to_check, archver.arch, project, options)
-            if max_rev > 0:
-                rev[archver] = max_rev
-
+            repos_by_archver[archver] = repos_to_check
+
+        # fetch the revisions of all groups at once instead of one group after the other
+        rev = {
+            archver: max_rev
+            for archver, max_rev in get_max_revisions(repos_by_archver, project, options, concurrent=concurrent).items()
+            if max_rev > 0
+        }
         if not rev:
             raise NoRepoFoundError
         return rev
@@ -240,10 +287,22 @@ class Submission:
     @staticmethod
     def is_livepatch(packages: list[str]) -> bool:
         """Check if a list of packages contains livepatch related ones."""
-        if any(p.startswith(("kernel-default", "kernel-source", "kernel-azure")) for p in packages):
-            return False
-        return any(p.startswith(("kgraft-patch-", "kernel-livepatch")) for p in packages)
+        livepatch = False
+        # single pass, bailing out as soon as a full kernel package shows up
+        for p in packages:
+            if p.startswith(KERNEL_PACKAGE_PREFIXES):
+                return False
+            livepatch = livepatch or p.startswith(LIVEPATCH_PACKAGE_PREFIXES)
+        return livepatch
 
     def contains_package(self, requires: list[str]) -> bool:
-        """Check if the submission contains any of the required packages."""
-        return any(p != "kernel-livepatch-tools" and p.startswith(tuple(requires)) for p in self.packages)
+        """Check if the submission contains any of the required packages.
+
+        The packages are matched by prefix, so the result is remembered per list of
+        required packages as the same flavor is checked on every architecture.
+        """
+        prefixes = tuple(requires)
+        if (found := self._contains_package.get(prefixes)) is None:
+            found = any(p.startswith(prefixes) and p != "kernel-livepatch-tools" for p in self.packages)
+            self._contains_package[prefixes] = found
+        return found
@@ -5,6 +5,8 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from logging import getLogger
 from typing import TYPE_CHECKING, Any, NamedTuple
 
@@ -19,18 +21,42 @@ from .baseconf import BaseConf, JobConfig
 from .types import ChannelType, ProdVer, Repos, get_channel_type
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Set as AbstractSet
+
     from .submission import Submission
 
 log = getLogger("bot.types.submissions")
 
+# issues of which a kernel submission needs at least one to have its product repository
+KERNEL_REPO_ISSUES = frozenset({
+    "OS_TEST_ISSUES",
+    "LTSS_TEST_ISSUES",
+    "BASE_TEST_ISSUES",
+    "RT_TEST_ISSUES",
+    "COCO_TEST_ISSUES",
+})
+
+_SCHEDULED_KEYS_CACHE: dict[tuple[int, str | None], frozenset[tuple[Any, ...]]] = {}
+
+
+def clear_cache() -> None:
+    """Clear the scheduled jobs fetched from the dashboard."""
+    _SCHEDULED_KEYS_CACHE.clear()
+
 
 class SubContext(NamedTuple):
-    """Context for a submission."""
+    """Context for a submission.
+
+    The issues of the flavor matching the submission are computed once when
+    the contexts are built, None if they still have to be matched.
+    """
 
     sub: Submission
     arch: str
     flavor: str
     data: dict[str, Any]
+    matches: dict[str, list[Repos]] | None = None
 
 
 class SubConfig(NamedTuple):
@@ -49,6 +75,7 @@ class Submissions(BaseConf):
         self.flavors = self.normalize_repos(config.config["FLAVOR"])
         self.singlearch = extrasettings
         self.valid_archs = {arch for data in self.flavors.values() for arch in data["archs"]}
+        self._base_settings: dict[tuple[str, str], dict[str, Any]] = {}
 
     def __repr__(self) -> str:
         """Return a string representation of the Submissions."""
@@ -56,12 +83,17 @@ class Submissions(BaseConf):
 
     @staticmethod
     def normalize_repos(config: dict[str, Any]) -> dict[str, Any]:
-        """Normalize repository configuration from settings."""
+        """Normalize repository configuration from settings.
+
+        The aggregate checks are turned into sets once instead of on every submission.
+        """
         return {
             flavor: {
                 key: (
                     {template: ProdVer.from_issue_channel(channel) for template, channel in value.items()}
                     if key == "issues"
+                    else frozenset(value)
+                    if key in {"aggregate_check_true", "aggregate_check_false"}
                     else value
                 )
                 for key, value in data.items()
@@ -77,16 +109,52 @@ class Submissions(BaseConf):
         return chan.product, chan.version, chan.arch
 
     @staticmethod
-    def _get_scheduled_jobs(sub_id: int, submission_type: str | None = None) -> list[dict[str, Any]]:
-        """Fetch scheduled jobs from the dashboard."""
+    @lru_cache(maxsize=1024)
+    def _updates_repo_suffix(chan: Repos) -> str:
+        """Return the 'SUSE_Updates_...' repository name of a channel, built once per channel."""
+        return "SUSE_Updates_" + "_".join(Submissions.repo_osuse(chan))
+
+    @staticmethod
+    def _get_scheduled_jobs(sub_id: int, submission_type: str | None = None) -> list[dict[str, Any]] | None:
+        """Fetch scheduled jobs from the dashboard, None if they could not be retrieved."""
         try:
             url = settings.dashboard_url("api", "incident_settings", sub_id)
             params = {"type": submission_type} if submission_type else {}
             res = retried_requests.get(url, headers=settings.dashboard_token_dict, params=params).json()
-            return res if isinstance(res, list) else []
         except (requests.exceptions.RequestException, json.JSONDecodeError):
             log.exception("Dashboard API error: Could not retrieve scheduled jobs for submission %s", sub_id)
-            return []
+            return None
+        return res if isinstance(res, list) else []
+
+    @staticmethod
+    def _prefetch_scheduled_jobs(subs: Iterable[Submission]) -> None:
+        """Fetch the scheduled jobs of the given submissions concurrently into the cache.
+
+        The jobs are flattened into their lookup sets right away, so checking a
+        flavor and architecture later is a plain set membership test.
+        """
+        keys = {(sub.id, sub.type) for sub in subs}.difference(_SCHEDULED_KEYS_CACHE)
+        with ThreadPoolExecutor(max_workers=settings.max_workers) as executor:
+            # consume the results so that an unexpected error in a worker is raised here
+            list(executor.map(lambda key: Submissions._scheduled_keys(*key), keys))
+
+    @staticmethod
+    def _scheduled_keys(sub_id: int, submission_type: str | None = None) -> frozenset[tuple[Any, ...]]:
+        """Return the (flavor, arch, version, repohash) of the jobs scheduled for a submission.
+
+        The jobs only depend on the submission but are checked for every flavor and
+        architecture, so the lookup set of successful responses is cached.
+        """
+        key = (sub_id, submission_type)
+        if (scheduled := _SCHEDULED_KEYS_CACHE.get(key)) is None:
+            jobs = Submissions._get_scheduled_jobs(sub_id, submission_type)
+            scheduled = frozenset(
+                (job.get("flavor"), job.get("arch"), job.get("version"), job.get("settings", {}).get("REPOHASH"))
+                for job in jobs or []
+            )
+            if jobs is not None:
+                _SCHEDULED_KEYS_CACHE[key] = scheduled
+        return scheduled
 
     @staticmethod
     def is_scheduled_job(ctx: SubContext, ver: str, submission_type: str | None = None) -> bool:
@@ -94,40 +162,80 @@ class Submissions(BaseConf):
         if not (revs := ctx.sub.revisions_with_fallback(ctx.arch, ver)):
             return False
 
-        jobs = Submissions._get_scheduled_jobs(ctx.sub.id, submission_type)
-        return any(
-            job["flavor"] == ctx.flavor
-            and job["arch"] == ctx.arch
-            and job["version"] == ver
-            and job.get("settings", {}).get("REPOHASH") == revs
-            for job in jobs
-        )
+        return (ctx.flavor, ctx.arch, ver, revs) in Submissions._scheduled_keys(ctx.sub.id, submission_type)
 
     def make_repo_url(self, sub: Submission, chan: Repos) -> str:
         """Construct the repository URL for a submission channel."""
+        return self._repo_url(f"{settings.download_maintenance}{sub.id}/", chan)
+
+    def _repo_url(self, maintenance_prefix: str, chan: Repos) -> str:
         return (
             gitea.compute_repo_url_for_job_setting(
                 settings.download_base_url, chan, self.product_repo, self.product_version
             )
             if get_channel_type(chan.product) == ChannelType.SLFO
-            else f"{settings.download_maintenance}{sub.id}/SUSE_Updates_{'_'.join(self.repo_osuse(chan))}"
+            else maintenance_prefix + self._updates_repo_suffix(chan)
         )
 
+    def _make_repo_urls(self, sub: Submission, chans: Iterable[Repos]) -> str:
+        """Return the sorted, comma separated repository URLs of submission channels."""
+        prefix = f"{settings.download_maintenance}{sub.id}/"
+        return ",".join(sorted(self._repo_url(prefix, chan) for chan in chans))
+
+    @staticmethod
+    def _match_slfo_channels(sub: Submission, channel: ProdVer, arch: str) -> list[Repos]:
+        """Find the channels of a submission matching an SLFO channel on the given architecture."""
+        return [
+            ic
+            for ic in sub.channels
+            if ic.arch == arch
+            and (
+                channel.product_version == ic.product_version
+                if channel.product_version
+                else ic.version.startswith(channel.version)
+            )
+        ]
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _arch_repo(channel: ProdVer, arch: str) -> Repos:
+        """Return the repository of a non-SLFO channel on an architecture, built once per channel."""
+        return Repos(channel.product, channel.version, arch, channel.product_version)
+
     def get_matching_channels(self, sub: Submission, channel: ProdVer, arch: str) -> list[Repos]:  # noqa: PLR6301
         """Find channels in a submission matching the given product and architecture."""
         if get_channel_type(channel.product) == ChannelType.SLFO:
-            return [
-                ic
-                for ic in sub.channels
-                if ic.arch == arch
-                and (
-                    channel.product_version == ic.product_version
-                    if channel.product_version
-                    else ic.version.startswith(channel.version)
-                )
-            ]
-        f_channel = Repos(channel.product, channel.version, arch, channel.product_version)
-        return [f_channel] if f_channel in sub.channels else []
+            return Submissions._match_slfo_channels(sub, channel, arch)
+        repo = Submissions._arch_repo(channel, arch)
+        return [repo] if repo in sub.channels_set else []
+
+    def _match_issues(self, ctx: SubContext) -> dict[str, list[Repos]]:
+        """Map the issues of a flavor, in their configured order, to the channels of the submission matching them."""
+        return {
+            issue: matched
+            for issue, channel in ctx.data.get("issues", {}).items()
+            if (matched := self.get_matching_channels(ctx.sub, channel, ctx.arch))
+        }
+
+    @staticmethod
+    def _schedulable(submissions: list[Submission]) -> list[Submission]:
+        """Drop the closed and staging submissions which are skipped on every flavor and architecture."""
+        schedulable = []
+        for sub in submissions:
+            if not sub.ongoing:
+                log.debug("Submission %s skipped: closed/approved/review no longer requested", sub)
+            elif not sub.staging:
+                schedulable.append(sub)
+        return schedulable
+
+    def _not_embargoed(self, submissions: list[Submission], flavor: str) -> list[Submission]:
+        """Drop the embargoed submissions if the flavor filters them, checking each once for all architectures."""
+        if not self.filter_embargoed(flavor):
+            return submissions
+        for sub in submissions:
+            if sub.embargoed:
+                log.info("Submission %s skipped: Embargoed and embargo-filtering enabled", sub)
+        return [sub for sub in submissions if not sub.embargoed]
 
     def _is_invalid_status(self, sub: Submission, arch: str, flavor: str) -> bool:
         if not sub.ongoing:
@@ -139,29 +247,50 @@ class Submissions(BaseConf):
         return sub.staging
 
     @staticmethod
-    def _is_invalid_package_or_channel(ctx: SubContext, matches: dict[str, list[Repos]]) -> bool:
-        sub, arch, flavor, data = ctx.sub, ctx.arch, ctx.flavor, ctx.data
+    def _is_filtered_package(sub: Submission, data: dict[str, Any]) -> bool:
+        """Check if the packages of a submission are not wanted on a flavor."""
         if data.get("packages") is not None and not sub.contains_package(data["packages"]):
             return True
-        if data.get("excluded_packages") is not None and sub.contains_package(data["excluded_packages"]):
+        return data.get("excluded_packages") is not None and sub.contains_package(data["excluded_packages"])
+
+    @staticmethod
+    def _lacks_required_issues(data: dict[str, Any], matches: dict[str, list[Repos]]) -> bool:
+        return "required_issues" in data and matches.keys().isdisjoint(data["required_issues"])
+
+    @staticmethod
+    def _lacks_kernel_repo(sub: Submission, flavor: str, matches: dict[str, list[Repos]]) -> bool:
+        if "Kernel" not in flavor or sub.livepatch or flavor.endswith("Azure"):
+            return False
+        return KERNEL_REPO_ISSUES.isdisjoint(matches)
+
+    @staticmethod
+    def _is_invalid_package_or_channel(ctx: SubContext, matches: dict[str, list[Repos]]) -> bool:
+        sub, arch, flavor, data = ctx.sub, ctx.arch, ctx.flavor, ctx.data
+        if Submissions._is_filtered_package(sub, data):
             return True
         if not matches:
             log.debug("Submission %s skipped for %s on %s: No matching channels found in metadata", sub, flavor, arch)
             return True
-        return bool("required_issues" in data and set(matches).isdisjoint(data["required_issues"]))
+        return Submissions._lacks_required_issues(data, matches)
 
     @staticmethod
     def _is_kernel_missing_repo(sub: Submission, flavor: str, matches: dict[str, list[Repos]]) -> bool:
         """Check if a Kernel submission is missing its product repository."""
-        if "Kernel" not in flavor or sub.livepatch or flavor.endswith("Azure"):
-            return False
-
-        allowed = {"OS_TEST_ISSUES", "LTSS_TEST_ISSUES", "BASE_TEST_ISSUES", "RT_TEST_ISSUES", "COCO_TEST_ISSUES"}
-        if set(matches).isdisjoint(allowed):
+        if Submissions._lacks_kernel_repo(sub, flavor, matches):
             log.warning("Submission %s skipped: Kernel submission missing product repository", sub)
             return True
         return False
 
+    @staticmethod
+    def _needs_scheduled_jobs(ctx: SubContext) -> bool:
+        """Check if a context passes the filters not needing the dashboard, without logging the skipped ones."""
+        matches = ctx.matches or {}
+        return bool(matches) and not (
+            Submissions._is_filtered_package(ctx.sub, ctx.data)
+            or Submissions._lacks_required_issues(ctx.data, matches)
+            or Submissions._lacks_kernel_repo(ctx.sub, ctx.flavor, matches)
+        )
+
     def should_skip(self, ctx: SubContext, cfg: SubConfig, matches: dict[str, list[Repos]]) -> bool:
         """Check if a submission context should be skipped."""
         if self._is_invalid_status(ctx.sub, ctx.arch, ctx.flavor):
@@ -170,29 +299,44 @@ class Submissions(BaseConf):
         if self._is_invalid_package_or_channel(ctx, matches):
             return True
 
+        # checked before the scheduled jobs so that only the dashboard lookup is left
+        if self._is_kernel_missing_repo(ctx.sub, ctx.flavor, matches):
+            return True
+
         if not cfg.ignore_onetime and self.is_scheduled_job(
             ctx, self.settings["VERSION"], submission_type=ctx.sub.type
         ):
             log.info("Submission %s already scheduled for %s on %s", ctx.sub, ctx.flavor, ctx.arch)
             return True
 
-        return self._is_kernel_missing_repo(ctx.sub, ctx.flavor, matches)
+        return False
+
+    def _flavor_settings(self, arch: str, flavor: str) -> dict[str, Any]:
+        """Return the openQA settings shared by all submissions on a flavor and architecture."""
+        key = (arch, flavor)
+        if key not in self._base_settings:
+            self._base_settings[key] = {
+                **self.settings,
+                "ARCH": arch,
+                "FLAVOR": flavor,
+                "VERSION": self.settings["VERSION"],
+                "DISTRI": self.settings["DISTRI"],
+                **OBSOLETE_PARAMS,
+            }
+        return self._base_settings[key]
 
     def get_base_settings(self, ctx: SubContext, revs: int, cfg: SubConfig) -> dict[str, Any]:
         """Return base openQA settings for a submission."""
-        sub, arch, flavor = ctx.sub, ctx.arch, ctx.flavor
-        return {
-            **self.settings,
-            "ARCH": arch,
-            "FLAVOR": flavor,
-            "VERSION": f"{self.settings['VERSION']}:{sub.type}-{sub.id}"
-            if ctx.data.get("versioned_by_submission", False)
-            else self.settings["VERSION"],
-            "DISTRI": self.settings["DISTRI"],
+        sub = ctx.sub
+        return self._flavor_settings(ctx.arch, ctx.flavor) | {
+            **(
+                {"VERSION": f"{self.settings['VERSION']}:{sub.type}-{sub.id}"}
+                if ctx.data.get("versioned_by_submission", False)
+                else {}
+            ),
             "INCIDENT_ID": sub.id,
             "REPOHASH": revs,
             "BUILD": f":{sub.type}:{sub.id}:{sub.packages[0]}",
-            **OBSOLETE_PARAMS,
             **({"__CI_JOB_URL": cfg.ci_url} if cfg.ci_url else {}),
             **({"KGRAFT": "1"} if sub.livepatch else {}),
             **({"RRID": sub.rrid} if sub.rrid else {}),
@@ -244,15 +388,15 @@ class Submissions(BaseConf):
                 return None
         return settings
 
-    def is_aggregate_needed(self, ctx: SubContext, openqa_keys: set[str]) -> bool:
+    def is_aggregate_needed(self, ctx: SubContext, openqa_keys: AbstractSet[str]) -> bool:
         """Check if an aggregate job is needed for this submission."""
         sub, data = ctx.sub, ctx.data
-        if not self.singlearch.isdisjoint(set(sub.packages)):
+        if not self.singlearch.isdisjoint(sub.packages):
             return False
         if data.get("aggregate_job", True):
             return True
-        pos, neg = set(data.get("aggregate_check_true", [])), set(data.get("aggregate_check_false", []))
-        if (pos and not pos.isdisjoint(openqa_keys)) or (neg and neg.isdisjoint(openqa_keys)):
+        pos, neg = data.get("aggregate_check_true", ()), data.get("aggregate_check_false", ())
+        if (pos and not openqa_keys.isdisjoint(pos)) or (neg and openqa_keys.isdisjoint(neg)):
             log.info("Submission %s: Aggregate job not required", sub)
             return False
         return bool(neg and pos)
@@ -261,12 +405,11 @@ class Submissions(BaseConf):
         self, ctx: SubContext, cfg: SubConfig, matches: dict[str, list[Repos]], version: str, revs: int
     ) -> dict[str, Any] | None:
         settings = self.get_base_settings(ctx, revs, cfg)
-        for issue in matches:
-            settings[issue] = str(ctx.sub.id)
+        settings |= dict.fromkeys(matches, str(ctx.sub.id))
 
         all_repos = {c for matched in matches.values() for c in matched}
         repos = {c for c in all_repos if c.product_version == version} or all_repos
-        settings["INCIDENT_REPO"] = ",".join(sorted(self.make_repo_url(ctx.sub, chan) for chan in repos))
+        settings["INCIDENT_REPO"] = self._make_repo_urls(ctx.sub, repos)
 
         settings["_PRIORITY"] = self.get_priority(ctx)
 
@@ -278,11 +421,7 @@ class Submissions(BaseConf):
 
     def handle_submission(self, ctx: SubContext, cfg: SubConfig) -> dict[str, Any] | None:
         """Process a submission context and return dashboard post data."""
-        matches = {
-            issue: matched
-            for issue, channel in ctx.data.get("issues", {}).items()
-            if (matched := self.get_matching_channels(ctx.sub, channel, ctx.arch))
-        }
+        matches = self._match_issues(ctx) if ctx.matches is None else ctx.matches
         if self.should_skip(ctx, cfg, matches):
             return None
 
@@ -307,7 +446,7 @@ class Submissions(BaseConf):
                 "arch": ctx.arch,
                 "flavor": ctx.flavor,
                 "version": self.settings["VERSION"],
-                "withAggregate": self.is_aggregate_needed(ctx, set(settings.keys())),
+                "withAggregate": self.is_aggregate_needed(ctx, settings.keys()),
                 "settings": settings,
             },
             "openqa": settings,
@@ -317,6 +456,20 @@ class Submissions(BaseConf):
         """Process a single submission context."""
         return self.handle_submission(ctx, cfg)
 
+    def _with_revisions(self, submissions: list[Submission]) -> list[Submission]:
+        """Compute the revisions of the submissions concurrently and keep the ones having some.
+
+        The repositories of each submission are fetched serially in its worker so that
+        the number of concurrent requests stays bounded by one pool.
+        """
+
+        def compute(sub: Submission) -> bool:
+            return sub.compute_revisions_for_product_repo(self.product_repo, self.product_version, concurrent=False)
+
+        with ThreadPoolExecutor(max_workers=settings.max_workers) as executor:
+            computed = list(executor.map(compute, submissions))
+        return [sub for sub, ok in zip(submissions, computed, strict=True) if ok]
+
     def __call__(
         self,
         submissions: list[Submission],
@@ -327,14 +480,17 @@ class Submissions(BaseConf):
         """Process all submissions and return a list of posts for the dashboard."""
         cfg = SubConfig(ci_url=ci_url, ignore_onetime=ignore_onetime)
 
-        active = [
-            s for s in submissions if s.compute_revisions_for_product_repo(self.product_repo, self.product_version)
-        ]
+        active = self._with_revisions(self._schedulable(submissions))
 
-        return [
-            r
-            for flavor, data in self.flavors.items()
-            for arch in data["archs"]
-            for sub in active
-            if (r := self.process_sub_context(SubContext(sub, arch, flavor, data), cfg))
-        ]
+        contexts = []
+        for flavor, data in self.flavors.items():
+            eligible = self._not_embargoed(active, flavor)
+            for arch in data["archs"]:
+                for sub in eligible:
+                    ctx = SubContext(sub, arch, flavor, data)
+                    contexts.append(ctx._replace(matches=self._match_issues(ctx)))
+        if not ignore_onetime:
+            # look up the dashboard in parallel rather than once per submission while processing
+            self._prefetch_scheduled_jobs(ctx.sub for ctx in contexts if self._needs_scheduled_jobs(ctx))
+
+        return [r for ctx in contexts if (r := self.process_sub_context(ctx, cfg))]
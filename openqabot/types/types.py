@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 from enum import Enum, auto
+from functools import lru_cache
 from typing import TYPE_CHECKING, NamedTuple
 
 from openqabot.config import OBS_REPO_TYPE
@@ -29,6 +30,7 @@ _CHANNEL_PREFIX_MAP = {
 }
 
 
+@lru_cache(maxsize=512)
 def get_channel_type(product: str) -> ChannelType:
     """Determine the channel type based on the product string."""
     return next(
@@ -53,23 +55,44 @@ class Repos(NamedTuple):
         path: str = "repodata/repomd.xml",
         project: str | None = None,
     ) -> str:
-        """Construct the repository URL."""
-        arch = arch or self.arch
-        if get_channel_type(self.product) == ChannelType.SLFO or project == "SLFO":
-            product = self.product.replace(":", ":/")
-            version = self.version.replace(":", ":/")
-            start = f"{base}/{product}:/{version}/{OBS_REPO_TYPE}"
-            if not product_name:
-                return f"{start}/{path}"
-            if not self.product_version:
-                msg = f"Product version must be provided for {product_name}"
-                raise ValueError(msg)
-            return f"{start}/repo/{product_name}-{self.product_version}-{arch}/{path}"
-
-        url_base = f"{base}/{project.replace(':', ':/')}" if project else base
-        if get_channel_type(self.product) == ChannelType.OPENSUSE:
-            return f"{url_base}/SUSE_Updates_{self.product}_{self.version}/{path}"
-        return f"{url_base}/SUSE_Updates_{self.product}_{self.version}_{arch}/{path}"
+        """Construct the repository URL.
+
+        The same channels are looked up for many flavors and submissions, so the
+        URLs are cached instead of being escaped and formatted again.
+        """
+        repo = (self.product, self.version, arch or self.arch, self.product_version)
+        return _compute_url(repo, base, product_name, path, project)
+
+
+@lru_cache(maxsize=4096)
+def _compute_url(
+    repo: tuple[str, str, str, str],
+    base: str,
+    product_name: str | None,
+    path: str,
+    project: str | None,
+) -> str:
+    """Construct the URL of a repository given by its product, version, architecture and product version.
+
+    The cache is keyed on these plain fields, so it does not keep Repos instances alive.
+    """
+    repo_product, repo_version, arch, repo_product_version = repo
+    channel_type = get_channel_type(repo_product)
+    if channel_type == ChannelType.SLFO or project == "SLFO":
+        product = repo_product.replace(":", ":/")
+        version = repo_version.replace(":", ":/")
+        start = f"{base}/{product}:/{version}/{OBS_REPO_TYPE}"
+        if not product_name:
+            return f"{start}/{path}"
+        if not repo_product_version:
+            msg = f"Product version must be provided for {product_name}"
+            raise ValueError(msg)
+        return f"{start}/repo/{product_name}-{repo_product_version}-{arch}/{path}"
+
+    url_base = f"{base}/{project.replace(':', ':/')}" if project else base
+    if channel_type == ChannelType.OPENSUSE:
+        return f"{url_base}/SUSE_Updates_{repo_product}_{repo_version}/{path}"
+    return f"{url_base}/SUSE_Updates_{repo_product}_{repo_version}_{arch}/{path}"
 
 
 class ProdVer(NamedTuple):
@@ -80,8 +103,12 @@ class ProdVer(NamedTuple):
     product_version: str = ""  # if non-empty, "version" is the codestream version or OBS project
 
     @classmethod
+    @lru_cache(maxsize=1024)
     def from_issue_channel(cls, issue: str) -> ProdVer:
-        """Create a ProdVer from an issue channel string like 'SLFO:project#version'."""
+        """Create a ProdVer from an issue channel string like 'SLFO:project#version'.
+
+        The same channels are used by many flavors, so their parsed form is shared.
+        """
         channel_parts = issue.split(":")
         version_parts = channel_parts[1].split("#")
         return cls(channel_parts[0], version_parts[0], version_parts[1] if len(version_parts) > 1 else "")
@@ -8,6 +8,7 @@ import logging
 import os
 import re
 from copy import deepcopy
+from pprint import pformat
 from typing import TYPE_CHECKING, Any
 
 from requests import Session
@@ -19,6 +20,7 @@ if TYPE_CHECKING:
 
 
 ANSI_ESCAPE_RE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+MULTIPLE_SPACES_RE = re.compile(r" {2,}")
 
 
 def create_logger(name: str) -> logging.Logger:
@@ -35,6 +37,20 @@ def create_logger(name: str) -> logging.Logger:
     return log
 
 
+class LazyPformat:
+    """Pretty-print an object only once a log record using it is actually emitted."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: object) -> None:
+        """Wrap the object to pretty-print."""
+        self.obj = obj
+
+    def __str__(self) -> str:
+        """Return the pretty-printed object."""
+        return pformat(self.obj)
+
+
 def strip_ansi(text: str) -> str:
     """Strip ANSI escape sequences from text for resilient matching."""
     return ANSI_ESCAPE_RE.sub("", text)
@@ -43,7 +59,7 @@ def strip_ansi(text: str) -> str:
 def normalize_whitespace(text: str) -> str:
     """Collapse multiple spaces and normalize line endings for resilient comparison."""
     # Collapse multiple spaces into one
-    text = re.sub(r" +", " ", text)
+    text = MULTIPLE_SPACES_RE.sub(" ", text)
     # Strip leading/trailing whitespace from each line and the whole block
     return "\n".join(line.strip() for line in text.splitlines()).strip()
 
@@ -141,6 +157,9 @@ def make_retry_session(retries: int, backoff_factor: float) -> Session:
             backoff_factor=backoff_factor,
             status_forcelist=frozenset({403, 413, 429, 503}),
         ),
+        # keep enough connections alive for the concurrent repository metadata fetches
+        pool_connections=32,
+        pool_maxsize=64,
     )
     http = Session()
     http.mount("https://", adapter)
@@ -19,11 +19,14 @@ from openqabot.approver import Approver
 from openqabot.config import Settings, settings
 from openqabot.dashboard import clear_cache
 from openqabot.errors import NoResultsError
+from openqabot.loader import config as loader_config
+from openqabot.loader import repohash
 from openqabot.loader.gitea import read_json_file
 from openqabot.loader.qem import JobAggr
 from openqabot.openqa import OpenQAInterface
 from openqabot.repodiff import Package
 from openqabot.requests import find_request_on_obs, get_obs_request_list
+from openqabot.types import submissions
 
 from .helpers import (
     add_two_passed_response,
@@ -126,6 +129,9 @@ def make_approver(submission: int = 0, *, mocker: MockerFixture | None = None, c
 @pytest.fixture(autouse=True)  # noqa: RUF076 - pytest autouse required to clear cache automatically before every test
 def _auto_clear_cache() -> None:
     clear_cache()
+    repohash.clear_cache()
+    submissions.clear_cache()
+    loader_config.clear_cache()
 
 
 @pytest.fixture(scope="session")
@@ -40,9 +40,11 @@ class MockSubmission(Submission):
         product_repo: list[str] | str | None,
         product_version: str | None,
         limit_archs: set[str] | None = None,
+        *,
+        concurrent: bool = True,
     ) -> bool:
         """Mock compute_revisions_for_product_repo."""
-        _ = (product_repo, product_version, limit_archs)
+        _ = (product_repo, product_version, limit_archs, concurrent)
         return self.compute_revisions_value
 
     def revisions_with_fallback(self, arch: str, ver: str) -> int | None:
@@ -7,6 +7,7 @@ from __future__ import annotations
 import logging
 import re
 from argparse import Namespace
+from io import BytesIO
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 from urllib.error import HTTPError
@@ -14,7 +15,6 @@ from urllib.parse import urljoin, urlparse
 
 import pytest
 import responses
-from lxml import etree  # noqa: TC002  # ty: ignore[unresolved-import]
 from responses import GET, matchers
 
 from openqabot.config import settings
@@ -27,7 +27,6 @@ from openqabot.loader.gitea import (
     get_product_name_and_version_from_scmsync,
     read_json_file,
     read_utf8,
-    read_xml,
     review_pr,
 )
 from openqabot.types.types import ProdVer, Repos
@@ -82,20 +81,20 @@ def fake_repo() -> None:
     responses.add(GET, url, body=listing, match=[matchers.query_param_matcher({"jsontable": "1"})])
 
 
-def fake_osc_http_get(url: str) -> etree.ElementTree:
+def fake_osc_http_get(url: str) -> BytesIO:
     if url == f"{settings.obs_url}/build/SUSE:SLFO:1.1.99:PullRequest:124/_result":
-        return read_xml("build-results-124-SUSE:SLFO:1.1.99:PullRequest:124")
+        return BytesIO(
+            Path("tests/fixtures/responses/build-results-124-SUSE:SLFO:1.1.99:PullRequest:124.xml").read_bytes()
+        )
     if url == f"{settings.obs_url}/build/SUSE:SLFO:1.1.99:PullRequest:124:SLES/_result":
-        return read_xml("build-results-124-SUSE:SLFO:1.1.99:PullRequest:124:SLES")
+        return BytesIO(
+            Path("tests/fixtures/responses/build-results-124-SUSE:SLFO:1.1.99:PullRequest:124:SLES.xml").read_bytes()
+        )
     raise AssertionError("Code tried to query unexpected OSC URL: " + url)  # pragma: no cover
 
 
-def noop_osc_http_get(_url: str) -> etree.ElementTree:
-    return read_xml("empty-build-results")
-
-
-def fake_osc_xml_parse(data: Any) -> Any:
-    return data  # fake_osc_http_get already returns parsed XML so just return that
+def noop_osc_http_get(_url: str) -> BytesIO:
+    return BytesIO(Path("tests/fixtures/responses/empty-build-results.xml").read_bytes())
 
 
 def fake_urllib_http_error(data: Any) -> Any:
@@ -134,7 +133,6 @@ def args() -> Namespace:
 @pytest.fixture
 def gitea_sync_mocks(mocker: MockerFixture) -> None:
     mocker.patch("openqabot.loader.gitea.http_GET", side_effect=fake_osc_http_get)
-    mocker.patch("osc.util.xml.xml_parse", side_effect=fake_osc_xml_parse)
     mocker.patch("osc.conf.get_config", side_effect=fake_osc_get_config)
     mocker.patch("openqabot.loader.gitea.get_multibuild_data", side_effect=fake_get_multibuild_data)
 
@@ -244,6 +242,7 @@ def test_sync_without_results(mocker: MockerFixture, caplog: pytest.LogCaptureFi
 def test_extracting_product_name_and_version() -> None:
     assert not get_product_name("1.1.99:PullRequest:166")
     assert get_product_name("1.1.99:PullRequest:166:SLES") == "SLES"
+    assert get_product_name("1.1.99:PullRequest:166:SLES") is get_product_name("1.1.99:PullRequest:166:SLES")
 
     slfo_url = "https://src.suse.de/user1/SLFO.git?onlybuild=tree#f229f"
     prod_ver = get_product_name_and_version_from_scmsync(slfo_url)
@@ -5,26 +5,26 @@
 from __future__ import annotations
 
 import logging
+import sys
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
-from ruamel.yaml import YAML, YAMLError
-from ruamel.yaml.constructor import ConstructorError, SafeConstructor
-from ruamel.yaml.nodes import SequenceNode
+import yaml
+from yaml import SequenceNode, YAMLError
+from yaml.constructor import ConstructorError
 
+from openqabot.loader import config as loader_config
 from openqabot.loader.config import (
-    ConcatSafeConstructor,
-    concat_constructor,
+    ConcatSafeLoader,
     get_onearch,
     load_metadata,
     read_products,
 )
+from openqabot.types.submissions import Submissions
 from openqabot.types.types import Data
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
-
     from pytest_mock import MockerFixture
 
 __root__ = Path(__file__).parent / "fixtures/config"
@@ -42,6 +42,32 @@ def test_get_onearch_not_found() -> None:
     assert res == set()
 
 
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        ("# packages\n- a\n\n- b  \n", {"a", "b"}),
+        ("- 'a'\n- b # comment\n", {"a", "b"}),
+        ("- a\n- &b b\n- *b\n", {"a", "b"}),
+        ("[a, b]", {"a", "b"}),
+        ("- [unclosed", set()),
+        ("- a\n- 123\n", {"a", 123}),
+        ("- a\n- null\n- ~\n", {"a", None}),
+        ("- a\n- true\n- Off\n", {"a", True, False}),
+        ("- libstdc++6\n- python3.11-foo_bar\n", {"libstdc++6", "python3.11-foo_bar"}),
+    ],
+)
+def test_get_onearch_content(tmp_path: Path, content: str, expected: set[str]) -> None:
+    """Plain lists are read directly, anything else goes through the YAML parser."""
+    file_path = tmp_path / "onearch.yml"
+    file_path.write_text(content)
+    assert get_onearch(file_path) == expected
+
+
+@pytest.mark.parametrize("content", ["- 123\n", "- null\n", "- ~\n", "- true\n", "- Off\n", "- foo:\n", "- b # c\n"])
+def test_flat_list_leaves_non_names_to_parser(content: str) -> None:
+    assert loader_config._flat_list("- a\n" + content) is None  # noqa: SLF001
+
+
 def test_load_metadata_aggregate_all_files_in_folder(caplog: pytest.LogCaptureFixture) -> None:
     caplog.set_level(logging.DEBUG, logger="bot.loader.config")
     result = load_metadata(__root__, aggregate=False, submissions=True, extrasettings=set())
@@ -121,6 +147,13 @@ def test_read_products(caplog: pytest.LogCaptureFixture) -> None:
     )
 
 
+def test_read_products_shares_names() -> None:
+    result = read_products(__root__)
+    assert {id(getattr(d, field)) for d in result for field in ("flavor", "distri", "version", "product")} == {
+        id(sys.intern(s)) for s in ("Server-DVD-Updates", "bar", "15-SP3", "SOME15SP3")
+    }
+
+
 def test_read_products_file(caplog: pytest.LogCaptureFixture) -> None:
     caplog.set_level(logging.DEBUG, logger="bot.loader.config")
 
@@ -157,125 +190,137 @@ def test_read_products_file(caplog: pytest.LogCaptureFixture) -> None:
     )
 
 
-def test_invalid_yaml_file_is_skipped(mocker: MockerFixture, caplog: pytest.LogCaptureFixture) -> None:
-    mock_yaml_class = mocker.patch("openqabot.loader.config.YAML")
-    mock_yaml_class.return_value.load.side_effect = YAMLError("Simulated YAML error")
-    file_path = __root__ / "simulated_invalid.yml"
+def test_invalid_yaml_file_is_skipped(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    file_path = tmp_path / "invalid.yml"
+    file_path.write_text("product: [unclosed")
     load_metadata(file_path, aggregate=False, submissions=True, extrasettings=set())
     assert "YAML load failed" in caplog.text
 
 
+def test_invalid_concat_yaml_file_is_skipped(mocker: MockerFixture, caplog: pytest.LogCaptureFixture) -> None:
+    mocker.patch("openqabot.loader.config.yaml.load", side_effect=YAMLError("Simulated YAML error"))
+    load_metadata(
+        Path(__file__).parent / "fixtures/config-concat", aggregate=False, submissions=True, extrasettings=set()
+    )
+    assert "YAML load failed" in caplog.text
+
+
+def test_load_metadata_concat_file() -> None:
+    result = load_metadata(
+        Path(__file__).parent / "fixtures/config-concat", aggregate=True, submissions=False, extrasettings=set()
+    )
+    assert len(result) == 1
+    assert isinstance(result[0], Submissions)
+    assert result[0].flavors["Server-DVD-Incidents-Kernel"]["packages"] == [
+        "kernel-source",
+        "kernel-livepatch",
+        "kernel-azure",
+    ]
+
+
+def test_load_metadata_uses_concat_loader(mocker: MockerFixture) -> None:
+    spy = mocker.spy(yaml, "load")
+    load_metadata(__root__ / "05_normal.yml", aggregate=False, submissions=False, extrasettings=set())
+    assert spy.call_args.kwargs["Loader"] is ConcatSafeLoader
+
+
+def test_concat_not_supported_by_default_loader() -> None:
+    with pytest.raises(ConstructorError, match="could not determine a constructor for the tag '!concat'"):
+        yaml.load("result: !concat [ [a] ]", Loader=yaml.CSafeLoader)
+
+
+def test_read_products_uses_libyaml_loader(mocker: MockerFixture) -> None:
+    spy = mocker.spy(yaml, "load")
+    read_products(__root__ / "05_normal.yml")
+    assert spy.call_args.kwargs["Loader"] is yaml.CSafeLoader
+
+
+@pytest.mark.parametrize(("path", "parallel"), [("05_normal.yml", False), ("", True)])
+def test_read_products_parallel_only_for_many_files(mocker: MockerFixture, path: str, *, parallel: bool) -> None:
+    executor = mocker.spy(loader_config, "ThreadPoolExecutor")
+    assert read_products(__root__ / path)
+    assert executor.called is parallel
+
+
+def test_parsed_yaml_cached_until_file_changes(tmp_path: Path, mocker: MockerFixture) -> None:
+    file_path = tmp_path / "products.yml"
+    file_path.write_text("product: A")
+    spy = mocker.spy(yaml, "load")
+    assert loader_config._parse_yaml(file_path) == {"product": "A"}  # noqa: SLF001
+    assert loader_config._parse_yaml(file_path) == {"product": "A"}  # noqa: SLF001
+    assert spy.call_count == 1
+
+    file_path.write_text("product: BB")
+    assert loader_config._parse_yaml(file_path) == {"product": "BB"}  # noqa: SLF001
+    assert spy.call_count == 2
+
+
 def test_load_one_metadata_missing_settings(caplog: pytest.LogCaptureFixture, mocker: MockerFixture) -> None:
     caplog.set_level(logging.INFO)
     # Mock get_yml_list to return one path
     mocker.patch("openqabot.loader.config.get_yml_list", return_value=[Path("fake.yml")])
-    # Mock YAML.load to return data without settings
-    mock_yaml = mocker.patch("openqabot.loader.config.YAML")
-    mock_yaml.return_value.load.return_value = {"product": "something"}
+    # Mock parsing to return data without settings
+    mocker.patch("openqabot.loader.config._parse_yaml", return_value={"product": "something"})
 
     result = load_metadata(Path(), aggregate=False, submissions=False, extrasettings=set())
     assert result == []
     assert "Configuration skipped: Missing settings in 'fake.yml'" in caplog.text
 
 
-def test_read_products_yaml_error(caplog: pytest.LogCaptureFixture, mocker: MockerFixture) -> None:
+def test_read_products_yaml_error(caplog: pytest.LogCaptureFixture, tmp_path: Path) -> None:
     caplog.set_level(logging.ERROR)
-    # Mock get_yml_list to return one path
-    mocker.patch("openqabot.loader.config.get_yml_list", return_value=[Path("invalid.yml")])
-    # Mock YAML.load to raise YAMLError
-    mock_yaml = mocker.patch("openqabot.loader.config.YAML")
-    mock_yaml.return_value.load.side_effect = YAMLError("Simulated error")
+    file_path = tmp_path / "invalid.yml"
+    file_path.write_text("product: [unclosed")
 
-    result = read_products(Path())
+    result = read_products(tmp_path)
     assert result == []
-    assert "YAML load failed: File invalid.yml" in caplog.text
+    assert f"YAML load failed: File {file_path}" in caplog.text
+
+
+def _safe_load(text: str, loader: type[ConcatSafeLoader] = ConcatSafeLoader) -> Any:
+    return yaml.load(text, Loader=loader)  # noqa: S506 - the loaders only extend the libyaml safe loader
 
 
 def test_concat_on_non_sequence_node_raises_clear_error() -> None:
-    loader = YAML(typ="safe")
-    loader.Constructor = ConcatSafeConstructor
     with pytest.raises(ConstructorError, match="expected a sequence node for !concat"):
-        loader.load("result: !concat scalar")
+        _safe_load("result: !concat scalar")
 
 
 def test_load_metadata_concat_simple_list() -> None:
-    loader = YAML(typ="safe")
-    loader.Constructor = ConcatSafeConstructor
     yaml_input = "result: !concat [ [a, b], [c, d] ]"
-    data = loader.load(yaml_input)
+    data = _safe_load(yaml_input)
     assert data["result"] == ["a", "b", "c", "d"]
 
 
 def test_load_metadata_concat_mixed_list_scalar() -> None:
-    loader = YAML(typ="safe")
-    loader.Constructor = ConcatSafeConstructor
     yaml_input = "result: !concat [ [a, b], scalar, [c] ]"
-    data = loader.load(yaml_input)
+    data = _safe_load(yaml_input)
     assert data["result"] == ["a", "b", "scalar", "c"]
 
 
 def test_load_metadata_concat_nested_and_anchors() -> None:
-    loader = YAML(typ="safe")
-    loader.Constructor = ConcatSafeConstructor
-    # Use anchor and alias to force generator usage in ruamel.yaml
     yaml_input = "result: !concat [ &l [a, b], *l ]"
-    data = loader.load(yaml_input)
+    data = _safe_load(yaml_input)
     assert data["result"] == ["a", "b", "a", "b"]
 
 
-def test_concat_constructor_container_unwrapping(mocker: MockerFixture) -> None:
-    """Verify that concat_constructor correctly unwraps ruamel.yaml containers.
-
-    In ruamel.yaml (when using typ='safe'), the construct_object method does not always
-    return the final Python object immediately.
-    For complex structures like sequences (lists) and mappings (dicts), it returns a generator.
-    This design allows the library to handle self-referential anchors and aliases
-    by yielding a placeholder before fully populating the object.
-    This test ensures that concat_constructor correctly detects these generators and
-    "unwraps" them to get the actual list or dictionary content.
-    The test uses mock to simulate the internal state of ruamel.yaml without actually parsing a YAML string:
-      1. `mock_constructor`: Mocks the SafeConstructor.
-      2. `my_container()`: generator that yields a list: ["unwrapped"].
-      3. `mock_node`: Mocks a SequenceNode (the !concat tag's content).
-      4. `construct_object` setup: The mock is configured to return the my_container() generator when called.
-    """
-    mock_constructor = mocker.Mock()
-
-    def my_container() -> Iterator[list[str]]:
-        yield ["unwrapped"]
-
-    # object with __next__
-    mock_constructor.construct_object.return_value = my_container()
-
-    mock_node = mocker.Mock(spec=SequenceNode)
-    mock_node.value = [mocker.Mock()]
-
-    it = concat_constructor(mock_constructor, mock_node)
-    res = next(it)
-    with pytest.raises(StopIteration):
-        next(it)
-    assert res == ["unwrapped"]
+def test_load_metadata_concat_alias_of_concat() -> None:
+    """An alias to a !concat node refers to the fully concatenated list."""
+    yaml_input = "first: &c !concat [ [a], [b] ]\nsecond: !concat [ *c, [d] ]"
+    data = _safe_load(yaml_input)
+    assert data == {"first": ["a", "b"], "second": ["a", "b", "d"]}
 
 
 def test_concat_with_tuple_behavior() -> None:
-    """Demonstrate why hasattr(obj, '__next__') is required over '__iter__'.
-
-    Using __iter__ a tuple would be incorrectly 'unwrapped', resulting in
-    only the first element being appended.
-    """
-    loader = YAML(typ="safe")
-    loader.Constructor = ConcatSafeConstructor
+    """Only lists are merged, other constructed objects like tuples are kept as single items."""
 
-    # We manually inject a tuple into the sequence to simulate a custom tag
-    # or a complex ruamel.yaml state.
-    class TupleConstructor(SafeConstructor):
+    class TupleLoader(ConcatSafeLoader):
         def construct_tuple(self, node: SequenceNode) -> tuple:
             return tuple(self.construct_sequence(node))
 
-    loader.Constructor.add_constructor("!tuple", TupleConstructor.construct_tuple)
+    TupleLoader.add_constructor("!tuple", TupleLoader.construct_tuple)
 
-    # YAML input where !concat contains a tuple
     yaml_input = "result: !concat [ !tuple [a, b], [c] ]"
-    data = loader.load(yaml_input)
+    data = _safe_load(yaml_input, TupleLoader)
 
     assert data["result"] == [("a", "b"), "c"]
@@ -8,6 +8,7 @@ from io import BytesIO
 from typing import Any, cast
 
 import pytest
+from lxml import etree  # ty: ignore[unresolved-import]
 from pytest_mock import MockerFixture
 
 from openqabot.loader import gitea
@@ -37,13 +38,14 @@ def test_add_build_results_url_mismatch_just_passes() -> None:
 
 def test_add_build_results_http_error(mocker: MockerFixture, caplog: pytest.LogCaptureFixture) -> None:
     caplog.set_level(logging.INFO, logger="bot.loader.gitea")
-    mocker.patch("openqabot.loader.gitea.determine_relevant_archs_from_multibuild_info", return_value=None)
+    archs = mocker.patch("openqabot.loader.gitea.determine_relevant_archs_from_multibuild_info", return_value=None)
     err = urllib.error.HTTPError("url", 404, "msg", cast("Any", {}), None)
     mocker.patch("openqabot.loader.gitea.http_GET", side_effect=err)
     incident = {"number": 123}
     gitea.add_build_results(incident, ["http://obs/project/show/proj"], dry=False)
     assert "Build results for project proj unreadable, skipping" in caplog.text
     assert "proj" in cast("list", incident["failed_or_unpublished_packages"])
+    archs.assert_not_called()
 
 
 def test_is_build_result_relevant_arch_filter(mocker: MockerFixture) -> None:
@@ -67,12 +69,12 @@ def test_add_build_result_published(mocker: MockerFixture) -> None:
 
     mocker.patch("openqabot.config.settings.obs_products", "all")
     mocker.patch("openqabot.loader.gitea.get_product_name", return_value="Foo")
-    results.unpublished.clear()
+    results = BuildResults()
     gitea.add_build_result(incident, res, results)
     assert "chan" in results.unpublished
 
     mocker.patch("openqabot.config.settings.obs_products", "SLES")
-    results.unpublished.clear()
+    results = BuildResults()
     gitea.add_build_result(incident, res, results)
     assert "chan" not in results.unpublished
 
@@ -98,6 +100,41 @@ def test_add_build_results_failed_packages(mocker: MockerFixture, caplog: pytest
     assert "pkg1" in cast("list", incident["failed_or_unpublished_packages"])
 
 
+def test_add_build_results_streams_results(mocker: MockerFixture) -> None:
+    mocker.patch("openqabot.loader.gitea.determine_relevant_archs_from_multibuild_info", return_value=None)
+    mocker.patch("openqabot.config.settings.obs_repo_type", None)
+    mocker.patch("openqabot.loader.gitea.get_product_version_from_repo_listing", return_value="15.4")
+    mocker.patch("openqabot.loader.gitea.get_product_name", return_value="SLES")
+    mocker.patch("openqabot.config.settings.obs_products", "SLES")
+    xml_data = """
+    <buildresults>
+        <result project="proj" repository="repo" arch="x86_64" state="published">
+            <status package="pkg1" code="failed"/>
+        </result>
+        <result project="proj" repository="repo" arch="aarch64" state="published">
+            <status package="pkg2" code="succeeded"/>
+        </result>
+        <result project="proj" repository="repo" arch="s390x" state="building"/>
+    </buildresults>
+    """
+    mocker.patch("openqabot.loader.gitea.http_GET", return_value=BytesIO(xml_data.encode()))
+    seen = []
+    add_build_result = gitea.add_build_result
+
+    def check_streamed(submission: dict[str, Any], res: Any, results: BuildResults) -> None:
+        # only the previous, already cleared result is still kept in the tree
+        seen.append([len(prev) for prev in res.itersiblings(preceding=True)])
+        add_build_result(submission, res, results)
+
+    mocker.patch("openqabot.loader.gitea.add_build_result", side_effect=check_streamed)
+    submission: dict[str, Any] = {"number": 123}
+    gitea.add_build_results(submission, ["http://obs/project/show/proj"], dry=False)
+    assert seen == [[], [0], [0]]
+    assert submission["failed_or_unpublished_packages"] == ["pkg1", "proj:s390x#15.4"]
+    assert submission["successful_packages"] == ["pkg2"]
+    assert submission["channels"] == ["proj:aarch64#15.4", "proj:s390x#15.4", "proj:x86_64#15.4"]
+
+
 def test_is_build_result_relevant_repo_match(mocker: MockerFixture) -> None:
     mocker.patch("openqabot.config.settings.obs_repo_type", "standard")
     res = {"repository": "standard", "arch": "x86_64"}
@@ -127,8 +164,8 @@ def test_add_build_results_duplicate_channels(mocker: MockerFixture) -> None:
     mocker.patch("openqabot.loader.gitea.determine_relevant_archs_from_multibuild_info", return_value=None)
     mocker.patch("openqabot.loader.gitea.get_product_name", return_value="SLES")
 
-    def mock_add_channel(_project: str, _arch: str, _product: str, _res: Any, projects: set[str]) -> str:
-        projects.add("chan")
+    def mock_add_channel(_project: str, _arch: str, _product: str, _res: Any, results: BuildResults) -> str:
+        results.projects.add("chan")
         return "chan"
 
     mocker.patch("openqabot.loader.gitea.add_channel_for_build_result", side_effect=mock_add_channel)
@@ -164,6 +201,11 @@ def test_add_comments_multiple_bot_comments(mocker: MockerFixture) -> None:
             "user": {"username": "autogits_obs_staging_bot"},
             "body": "Additional builds in https://build.suse.de/project/show/PROJ2",
         },
+        {
+            "user": {"username": "autogits_obs_staging_bot"},
+            "body": "Rebuilt https://build.suse.de/project/show/PROJ1",
+        },
+        {"user": {"username": "someone_else"}, "body": "See https://build.suse.de/project/show/PROJ3"},
     ]
 
     # We want to check if add_build_results is called with BOTH URLs.
@@ -173,7 +215,7 @@ def test_add_comments_multiple_bot_comments(mocker: MockerFixture) -> None:
 
     mock_add_build_results.assert_called_once()
     args, _ = mock_add_build_results.call_args
-    # Both URLs should be present and sorted
+    # Both URLs should be present once and sorted, URLs from other users are ignored
     assert args[1] == ["https://build.suse.de/project/show/PROJ1", "https://build.suse.de/project/show/PROJ2"]
 
 
@@ -215,3 +257,37 @@ def test_add_comments_bot_comments_no_urls(mocker: MockerFixture, caplog: pytest
     gitea.add_comments_and_referenced_build_results(submission, comments, dry=True)
     mock_add_build_results.assert_not_called()
     assert "PR git:123: No OBS URLs found in comments from autogits_obs_staging_bot" in caplog.text
+
+
+@pytest.mark.parametrize(
+    ("products", "product", "expected"),
+    [
+        ({"SLES", "SL-Micro"}, "SLES", True),
+        ({"SLES", "SL-Micro"}, "SL-Micro", True),
+        ({"SLES", "SL-Micro"}, "SLES_SAP", False),
+        ({"all"}, "SLES_SAP", True),
+    ],
+)
+def test_add_build_result_considered_products(
+    mocker: MockerFixture, products: set[str], product: str, *, expected: bool
+) -> None:
+    mocker.patch("openqabot.loader.gitea.get_product_name", return_value=product)
+    mocker.patch("openqabot.loader.gitea.add_channel_for_build_result", return_value="chan")
+    res = etree.fromstring(b'<result project="proj" arch="x86_64" state="building"/>')
+    results = BuildResults(products=products)
+    assert results.considers(product) is expected
+    gitea.add_build_result({}, res, results)
+    assert results.unpublished == ({"chan"} if expected else set())
+
+
+@pytest.mark.parametrize(
+    ("body", "expected"),
+    [
+        ("see https://build.suse.de/project/show/PROJ1...", ["https://build.suse.de/project/show/PROJ1"]),
+        ("https://a.b.c/x.y https://d/e.", ["https://a.b.c/x.y", "https://d/e"]),
+        ("https://... or http://", []),
+        ("[link](https://build.suse.de/project/show/A:B?x=1)", ["https://build.suse.de/project/show/A:B"]),
+    ],
+)
+def test_url_regex_trailing_dots(body: str, expected: list[str]) -> None:
+    assert gitea.URL_FINDALL_REGEX.findall(body) == expected
@@ -150,10 +150,10 @@ def test_get_product_version_from_repo_listing_requests_json_error(
 
 
 def test_add_channel_for_build_result_local() -> None:
-    projects: set[str] = set()
-    res = gitea.add_channel_for_build_result("myproj", "local", "myprod", None, projects)
+    results = gitea.BuildResults()
+    res = gitea.add_channel_for_build_result("myproj", "local", "myprod", None, results)
     assert res == "myproj:local"
-    assert len(projects) == 0
+    assert len(results.projects) == 0
 
 
 def test_get_json_success(mocker: MockerFixture) -> None:
@@ -201,6 +201,16 @@ def test_passed(mocked_openqa_bot: Namespace, caplog: pytest.LogCaptureFixture)
     assert "Triggering 1 products in openQA" in caplog.messages
 
 
+@pytest.mark.usefixtures("mock_runtime")
+def test_nothing_posted_on_failing_worker(mocked_openqa_bot: Namespace, mocker: MockerFixture) -> None:
+    bot = OpenQABot(mocked_openqa_bot)
+    bot.workers.append(mocker.Mock(side_effect=RuntimeError("broken product")))
+    post_openqa = mocker.patch.object(bot, "post_openqa")
+    with pytest.raises(RuntimeError, match="broken product"):
+        bot()
+    post_openqa.assert_not_called()
+
+
 @responses.activate
 @pytest.mark.usefixtures("mock_runtime", "mock_openqa_passed")
 def test_passed_non_osd(mocked_openqa_bot: Namespace, caplog: pytest.LogCaptureFixture) -> None:
@@ -2,10 +2,9 @@
 # SPDX-License-Identifier: MIT
 """Test PC helper."""
 
-import re
+from unittest.mock import MagicMock
 
 import pytest
-import responses
 from pytest_mock import MockerFixture
 
 import openqabot.pc_helper
@@ -16,6 +15,26 @@ from openqabot.pc_helper import (
     get_recent_pint_image,
 )
 
+PINT_SETTINGS = {
+    "PUBLIC_CLOUD_PINT_QUERY": "test",
+    "PUBLIC_CLOUD_PINT_NAME": "test",
+    "PUBLIC_CLOUD_PINT_FIELD": "image_id",
+}
+NO_PINT_IMAGES = {"images": []}
+PINT_IMAGE = {"name": "test", "state": "active", "image_id": "111"}
+PINT_IMAGE_SETTINGS = {
+    "PUBLIC_CLOUD_IMAGE_ID": "111",
+    "PUBLIC_CLOUD_IMAGE_NAME": "test",
+    "PUBLIC_CLOUD_IMAGE_STATE": "active",
+}
+
+
+@pytest.fixture
+def pint_image(mocker: MockerFixture) -> MagicMock:
+    """Stub the PINT query and return the stub selecting the most recent image."""
+    mocker.patch("openqabot.pc_helper.pint_query", return_value=NO_PINT_IMAGES)
+    return mocker.patch("openqabot.pc_helper.get_recent_pint_image", return_value=PINT_IMAGE)
+
 
 def test_apply_pc_tools_image(mocker: MockerFixture, caplog: pytest.LogCaptureFixture) -> None:
     known_return = "test"
@@ -43,79 +62,40 @@ def test_pint_query_uses_cache(mocker: MockerFixture) -> None:
     get_mock.assert_called_once()
 
 
-def test_apply_publiccloud_pint_image_empty_settings(mocker: MockerFixture) -> None:
-    mocker.patch("openqabot.pc_helper.pint_query", side_effect=lambda *_args, **_kwargs: {"images": []})
-    mocker.patch(
-        "openqabot.pc_helper.get_recent_pint_image",
-        side_effect=lambda *_args, **_kwargs: {"name": "test", "state": "active", "image_id": "111"},
-    )
-    settings = {}
-    apply_publiccloud_pint_image(settings)
-    assert settings["PUBLIC_CLOUD_IMAGE_ID"] is None
-    assert "PUBLIC_CLOUD_PINT_QUERY" not in settings
-    assert "PUBLIC_CLOUD_PINT_NAME" not in settings
-    assert "PUBLIC_CLOUD_PINT_REGION" not in settings
-    assert "PUBLIC_CLOUD_PINT_FIELD" not in settings
-    assert "PUBLIC_CLOUD_REGION" not in settings
-
-
-def test_apply_publiccloud_pint_image_simple_settings(mocker: MockerFixture) -> None:
-    mocker.patch("openqabot.pc_helper.pint_query", side_effect=lambda *_args, **_kwargs: {"images": []})
-    mocker.patch(
-        "openqabot.pc_helper.get_recent_pint_image",
-        side_effect=lambda *_args, **_kwargs: {"name": "test", "state": "active", "image_id": "111"},
-    )
-    settings = {
-        "PUBLIC_CLOUD_PINT_QUERY": "test",
-        "PUBLIC_CLOUD_PINT_NAME": "test",
-        "PUBLIC_CLOUD_PINT_FIELD": "image_id",
-    }
-    apply_publiccloud_pint_image(settings)
-    assert settings["PUBLIC_CLOUD_IMAGE_ID"] == "111"
-    assert "PUBLIC_CLOUD_PINT_QUERY" not in settings
-    assert "PUBLIC_CLOUD_PINT_NAME" not in settings
-    assert "PUBLIC_CLOUD_PINT_REGION" not in settings
-    assert "PUBLIC_CLOUD_PINT_FIELD" not in settings
-    assert "PUBLIC_CLOUD_REGION" not in settings
-
-
-def test_apply_publiccloud_pint_image_different_region(mocker: MockerFixture) -> None:
-    mocker.patch("openqabot.pc_helper.pint_query", side_effect=lambda *_args, **_kwargs: {"images": []})
-    mocker.patch(
-        "openqabot.pc_helper.get_recent_pint_image",
-        side_effect=lambda *_args, **_kwargs: {"name": "test", "state": "active", "image_id": "111"},
-    )
-    settings = {
-        "PUBLIC_CLOUD_PINT_QUERY": "test",
-        "PUBLIC_CLOUD_PINT_NAME": "test",
-        "PUBLIC_CLOUD_PINT_FIELD": "image_id",
-        "PUBLIC_CLOUD_PINT_REGION": "south",
-    }
-    apply_publiccloud_pint_image(settings)
-    assert settings["PUBLIC_CLOUD_IMAGE_ID"] == "111"
-    assert "PUBLIC_CLOUD_PINT_QUERY" not in settings
-    assert settings["PUBLIC_CLOUD_REGION"] == "south"
-    assert "PUBLIC_CLOUD_PINT_NAME" not in settings
-    assert "PUBLIC_CLOUD_PINT_REGION" not in settings
-    assert "PUBLIC_CLOUD_PINT_FIELD" not in settings
+def test_tools_image_query_uses_cache(mocker: MockerFixture) -> None:
+    get_mock = mocker.patch("openqabot.pc_helper.retried_requests.get")
+    for _ in range(1, 3):
+        openqabot.pc_helper.tools_image_query("foo")
+    get_mock.assert_called_once()
 
 
-def test_apply_publiccloud_pint_image_no_recent_image_found(mocker: MockerFixture) -> None:
-    mocker.patch("openqabot.pc_helper.pint_query", side_effect=lambda *_args, **_kwargs: {"images": []})
-    mocker.patch("openqabot.pc_helper.get_recent_pint_image", side_effect=lambda *_args, **_kwargs: None)
-    settings = {
-        "PUBLIC_CLOUD_PINT_QUERY": "test",
-        "PUBLIC_CLOUD_PINT_NAME": "test",
-        "PUBLIC_CLOUD_PINT_FIELD": "image_id",
-        "PUBLIC_CLOUD_PINT_REGION": "south",
-    }
+@pytest.mark.parametrize(
+    ("settings", "recent_image", "expected"),
+    [
+        pytest.param({}, PINT_IMAGE, {"PUBLIC_CLOUD_IMAGE_ID": None}, id="empty_settings"),
+        pytest.param(PINT_SETTINGS, PINT_IMAGE, PINT_IMAGE_SETTINGS, id="simple_settings"),
+        pytest.param(
+            PINT_SETTINGS | {"PUBLIC_CLOUD_PINT_REGION": "south"},
+            PINT_IMAGE,
+            PINT_IMAGE_SETTINGS | {"PUBLIC_CLOUD_REGION": "south"},
+            id="different_region",
+        ),
+        pytest.param(
+            PINT_SETTINGS | {"PUBLIC_CLOUD_PINT_REGION": "south"},
+            None,
+            {"PUBLIC_CLOUD_IMAGE_ID": None, "PUBLIC_CLOUD_REGION": "south"},
+            id="no_recent_image_found",
+        ),
+    ],
+)
+def test_apply_publiccloud_pint_image(
+    pint_image: MagicMock, settings: dict, recent_image: dict | None, expected: dict
+) -> None:
+    pint_image.return_value = recent_image
+    settings = settings.copy()
     apply_publiccloud_pint_image(settings)
-    assert settings["PUBLIC_CLOUD_IMAGE_ID"] is None
-    assert "PUBLIC_CLOUD_PINT_QUERY" not in settings
-    assert settings["PUBLIC_CLOUD_REGION"] == "south"
-    assert "PUBLIC_CLOUD_PINT_NAME" not in settings
-    assert "PUBLIC_CLOUD_PINT_REGION" not in settings
-    assert "PUBLIC_CLOUD_PINT_FIELD" not in settings
+    # all PUBLIC_CLOUD_PINT_* settings are consumed
+    assert settings == expected
 
 
 def test_apply_publiccloud_pint_image_exception(mocker: MockerFixture, caplog: pytest.LogCaptureFixture) -> None:
@@ -133,80 +113,60 @@ def test_apply_publiccloud_pint_image_exception(mocker: MockerFixture, caplog: p
     assert "PUBLIC_CLOUD_PINT_QUERY handling failed for test: oops" in caplog.text
 
 
-def test_apply_publiccloud_pint_image_already_has_id(mocker: MockerFixture) -> None:
-    mocker.patch("openqabot.pc_helper.pint_query", return_value={"images": []})
+@pytest.mark.usefixtures("pint_image")
+def test_apply_publiccloud_pint_image_already_has_id() -> None:
     settings = {"PUBLIC_CLOUD_IMAGE_ID": "existing"}
     apply_publiccloud_pint_image(settings)
     assert settings["PUBLIC_CLOUD_IMAGE_ID"] == "existing"
 
 
-def test_get_recent_pint_image() -> None:
-    images = []
-    ret = get_recent_pint_image(images, "test")
-    assert ret is None
-
-    img1 = {
-        "name": "test",
-        "state": "active",
-        "publishedon": "20231212",
-        "region": "south",
-    }
-    images.append(img1)
-    ret = get_recent_pint_image(images, "test")
-    assert ret == img1
-
-    ret = get_recent_pint_image(images, "AAAAA")
-    assert ret is None
-
-    ret = get_recent_pint_image(images, "test", "north")
-    assert ret is None
+ACTIVE_IMAGE = {"name": "test", "state": "active", "publishedon": "20231212", "region": "south"}
+INACTIVE_IMAGE = {"name": "test", "state": "inactive", "publishedon": "20231212", "region": "south"}
+NEWER_INACTIVE_IMAGE = {"name": "test", "state": "inactive", "publishedon": "30231212", "region": "south"}
+
+
+@pytest.mark.parametrize(
+    ("images", "args", "expected"),
+    [
+        pytest.param([], ("test",), None, id="no_images"),
+        pytest.param([ACTIVE_IMAGE], ("test",), ACTIVE_IMAGE, id="name"),
+        pytest.param([ACTIVE_IMAGE], ("AAAAA",), None, id="other_name"),
+        pytest.param([ACTIVE_IMAGE], ("test", "north"), None, id="other_region"),
+        pytest.param([ACTIVE_IMAGE], ("test", "south"), ACTIVE_IMAGE, id="region"),
+        pytest.param([ACTIVE_IMAGE], ("test", "south", "inactive"), None, id="other_state"),
+        pytest.param([ACTIVE_IMAGE, INACTIVE_IMAGE], ("test", "south", "inactive"), INACTIVE_IMAGE, id="state"),
+        pytest.param(
+            [ACTIVE_IMAGE, INACTIVE_IMAGE, NEWER_INACTIVE_IMAGE],
+            ("test", "south", "inactive"),
+            NEWER_INACTIVE_IMAGE,
+            id="most_recent",
+        ),
+    ],
+)
+def test_get_recent_pint_image(images: list[dict], args: tuple[str, ...], expected: dict | None) -> None:
+    assert get_recent_pint_image(images, *args) == expected
 
-    ret = get_recent_pint_image(images, "test", "south")
-    assert ret == img1
 
-    ret = get_recent_pint_image(images, "test", "south", "inactive")
-    assert ret is None
+def test_get_recent_pint_image_compares_publishedon_as_number() -> None:
+    older = {"name": "test", "state": "active", "publishedon": "9", "region": "south"}
+    newer = {"name": "test", "state": "active", "publishedon": "10", "region": "south"}
+    assert get_recent_pint_image([older, newer], "test") == newer
 
-    img2 = {
-        "name": "test",
-        "state": "inactive",
-        "publishedon": "20231212",
-        "region": "south",
-    }
-    images.append(img2)
-    ret = get_recent_pint_image(images, "test", "south", "inactive")
-    assert ret == img2
-
-    img3 = {
-        "name": "test",
-        "state": "inactive",
-        "publishedon": "30231212",
-        "region": "south",
-    }
-    images.append(img3)
-    ret = get_recent_pint_image(images, "test", "south", "inactive")
-    assert ret == img3
-
-
-@responses.activate
-def test_get_latest_tools_image() -> None:
-    responses.add(
-        responses.GET,
-        re.compile(r"http://url/.*"),
-        json={"build_results": []},
-    )
-    ret = get_latest_tools_image("http://url/results")
-    assert ret is None
 
-    responses.add(
-        responses.GET,
-        re.compile(r"http://url/.*"),
-        json={
+def test_get_latest_tools_image(mocker: MockerFixture) -> None:
+    get_mock = mocker.patch("openqabot.pc_helper.retried_requests.get")
+    get_mock.return_value.json.side_effect = [
+        {"build_results": []},
+        {
             "build_results": [
                 {"failed": 10, "build": "AAAAA"},
                 {"failed": 0, "build": "test"},
             ],
         },
-    )
+    ]
     ret = get_latest_tools_image("http://url/results")
+    assert ret is None
+
+    ret = get_latest_tools_image("http://url/other_results")
     assert ret == "publiccloud_tools_test.qcow2"
+    assert [c.args for c in get_mock.call_args_list] == [("http://url/results",), ("http://url/other_results",)]
@@ -18,7 +18,7 @@ import openqabot.loader.repohash as rp
 from openqabot.config import settings
 from openqabot.errors import NoRepoFoundError
 from openqabot.loader.repohash import RepoOptions
-from openqabot.types.types import Repos
+from openqabot.types.types import ArchVer, Repos
 
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
@@ -29,13 +29,19 @@ PROJECT = "SUSE:Maintenance:12345"
 SLES_URL = f"{settings.obs_download_url}/SUSE:/Maintenance:/12345/SUSE_Updates_SLES_15SP3_x86_64/repodata/repomd.xml"
 
 
+def max_revision(repos: list[Repos], arch: str, project: str, options: RepoOptions | None = None) -> int:
+    """Compute the maximum revision of a single group of repositories."""
+    archver = ArchVer(arch, "15-SP3")
+    return rp.get_max_revisions({archver: repos}, project, options)[archver]
+
+
 @responses.activate
 def test_get_max_revision_manager_aarch64() -> None:
     arch = "aarch64"
     repos = [Repos("SLE-Module-SUSE-Manager-Server", "4.1", arch)]
 
     with pytest.raises(NoRepoFoundError):
-        rp.get_max_revision(repos, arch, PROJECT)
+        max_revision(repos, arch, PROJECT)
 
 
 @responses.activate
@@ -45,7 +51,7 @@ def test_get_max_revision_opensuse() -> None:
     opensuse = BASE_XML % "256"
     url = f"{settings.obs_download_url}/SUSE:/Maintenance:/12345/SUSE_Updates_openSUSE-SLE_4.1/repodata/repomd.xml"
     responses.add(responses.GET, url=url, body=opensuse)
-    ret = rp.get_max_revision(repos, arch, PROJECT)
+    ret = max_revision(repos, arch, PROJECT)
     assert ret == 256
 
 
@@ -63,17 +69,54 @@ def add_sles_sled_response(
 @responses.activate
 def test_get_max_revision_3() -> None:
     add_sles_sled_response(BASE_XML % "257")
-    ret = rp.get_max_revision(repos, arch, PROJECT)
+    ret = max_revision(repos, arch, PROJECT)
     assert ret == 257
 
 
+@responses.activate
+def test_get_max_revision_cached() -> None:
+    add_sles_sled_response(BASE_XML % "257")
+    assert max_revision(repos, arch, PROJECT) == 257
+    assert max_revision(repos[::-1], arch, PROJECT) == 257
+    assert len(responses.calls) == 2
+
+    rp.clear_cache()
+    assert max_revision(repos, arch, PROJECT) == 257
+    assert len(responses.calls) == 4
+
+
+@responses.activate
+def test_get_max_revisions() -> None:
+    add_sles_sled_response(BASE_XML % "257")
+    sles, sled = ArchVer(arch, "15-SP3"), ArchVer(arch, "15-SP3-LTSS")
+    assert rp.get_max_revisions({sles: repos[:1], sled: repos[1:]}, PROJECT) == {sles: 256, sled: 257}
+    assert rp.get_max_revisions({}, PROJECT) == {}
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_get_max_revisions_serially(mocker: MockerFixture) -> None:
+    add_sles_sled_response(BASE_XML % "257")
+    pool = mocker.patch("openqabot.loader.repohash.ThreadPoolExecutor")
+    sles, sled = ArchVer(arch, "15-SP3"), ArchVer(arch, "15-SP3-LTSS")
+    result = rp.get_max_revisions({sles: repos[:1], sled: repos[1:]}, PROJECT, concurrent=False)
+    assert result == {sles: 256, sled: 257}
+    pool.assert_not_called()
+
+
+@responses.activate
+def test_get_max_revision_stops_at_first_revision() -> None:
+    responses.add(responses.GET, url=SLES_URL, body=SLES.replace("</repomd>", "<revision>999</revision><data"))
+    assert max_revision(repos[:1], arch, PROJECT) == 256
+
+
 @responses.activate
 def test_get_max_revision_connectionerror(caplog: pytest.LogCaptureFixture) -> None:
     caplog.set_level(logging.INFO, logger="bot.loader.repohash")
     add_sles_sled_response(requests.ConnectionError("Failed"))
 
     with pytest.raises(NoRepoFoundError):
-        rp.get_max_revision(repos, arch, PROJECT)
+        max_revision(repos, arch, PROJECT)
 
     assert "%s: RepoHash metadata not found at %s" in caplog.records[0].msg
     assert "SUSE:Maintenance:12345" in cast("str", cast("Any", caplog.records[0].args)[0])
@@ -85,7 +128,7 @@ def test_get_max_revision_httperror(caplog: pytest.LogCaptureFixture) -> None:
     add_sles_sled_response(requests.HTTPError("Failed"))
 
     with pytest.raises(NoRepoFoundError):
-        rp.get_max_revision(repos, arch, PROJECT)
+        max_revision(repos, arch, PROJECT)
 
     assert "%s: RepoHash metadata not found at %s" in caplog.records[0].msg
 
@@ -96,7 +139,7 @@ def test_get_max_revision_xmlerror(caplog: pytest.LogCaptureFixture) -> None:
     add_sles_sled_response("<invalid>")
 
     with pytest.raises(NoRepoFoundError):
-        rp.get_max_revision(repos, arch, PROJECT)
+        max_revision(repos, arch, PROJECT)
 
     assert "%s: RepoHash metadata not found at %s" in caplog.records[0].msg
 
@@ -107,7 +150,7 @@ def test_get_max_revision_empty_xml(caplog: pytest.LogCaptureFixture) -> None:
     add_sles_sled_response("<invalid></invalid>")
 
     with pytest.raises(NoRepoFoundError):
-        rp.get_max_revision(repos, arch, PROJECT)
+        max_revision(repos, arch, PROJECT)
 
     assert "%s: RepoHash calculation failed, no revision tag found in %s" in caplog.records[0].msg
 
@@ -117,7 +160,7 @@ def test_get_max_revision_exception(caplog: pytest.LogCaptureFixture) -> None:
     caplog.set_level(logging.DEBUG, logger="bot.loader.repohash")
     add_sles_sled_response(BufferError("other error"))
     with pytest.raises(BufferError):
-        rp.get_max_revision(repos, arch, PROJECT)
+        max_revision(repos, arch, PROJECT)
 
 
 @responses.activate
@@ -128,7 +171,7 @@ def test_get_max_revision_retry_error(caplog: pytest.LogCaptureFixture) -> None:
     responses.add(responses.GET, url=SLES_URL, body=requests.exceptions.RetryError("Max retries exceeded"))
 
     with pytest.raises(NoRepoFoundError):
-        rp.get_max_revision(repos, arch, project)
+        max_revision(repos, arch, project)
 
 
 @responses.activate
@@ -138,10 +181,22 @@ def test_get_max_revision_not_ok(caplog: pytest.LogCaptureFixture) -> None:
     project = "SUSE:Maintenance:12345"
     responses.add(responses.GET, url=SLES_URL, status=404)
 
-    assert rp.get_max_revision(repos, arch, project) == 0
+    assert max_revision(repos, arch, project) == 0
     assert "Submission skipped: RepoHash metadata not found at" in caplog.text
 
 
+@responses.activate
+def test_get_max_revision_not_ok_not_cached() -> None:
+    repos = [Repos("SLES", "15SP3", arch)]
+    responses.add(responses.GET, url=SLES_URL, status=404)
+    responses.add(responses.GET, url=SLES_URL, body=SLES)
+
+    assert max_revision(repos, arch, PROJECT) == 0
+    assert max_revision(repos, arch, PROJECT) == 256
+    assert max_revision(repos, arch, PROJECT) == 256
+    assert len(responses.calls) == 2
+
+
 @responses.activate
 def test_get_max_revision_with_submission_id_not_ok(caplog: pytest.LogCaptureFixture) -> None:
     caplog.set_level(logging.DEBUG, logger="bot.loader.repohash")
@@ -149,7 +204,7 @@ def test_get_max_revision_with_submission_id_not_ok(caplog: pytest.LogCaptureFix
     project = "SUSE:Maintenance:12345"
     opts = RepoOptions(submission_id="git:1461")
     responses.add(responses.GET, url=SLES_URL, status=404)
-    ret = rp.get_max_revision(repos, arch, project, options=opts)
+    ret = max_revision(repos, arch, project, options=opts)
 
     assert ret == 0
     assert "Submission skipped: RepoHash metadata not found at" in caplog.text
@@ -172,18 +227,18 @@ def test_get_max_revision_slfo(mocker: MockerFixture) -> None:
 
     # Call with product_version
     opts = RepoOptions(product_version=product_version)
-    ret = rp.get_max_revision(repos, arch, project, options=opts)
+    ret = max_revision(repos, arch, project, options=opts)
     assert ret == 123
     mock_compute_url.assert_called_with(ANY, "SLES", arch, project="SLFO")
 
     # Call without product_version
-    ret = rp.get_max_revision(repos, arch, project)
+    ret = max_revision(repos, arch, project)
     assert ret == 123
     mock_compute_url.assert_called_with(ANY, "SLES", arch, project="SLFO")
 
     # Call with product_name set
     opts = RepoOptions(product_name="SLES")
-    ret = rp.get_max_revision(repos, arch, project, options=opts)
+    ret = max_revision(repos, arch, project, options=opts)
     assert ret == 123
     mock_compute_url.assert_called_with(ANY, "SLES", arch, project="SLFO")
 
@@ -200,6 +255,6 @@ def test_get_max_revision_slfo_with_repo_version(mocker: MockerFixture) -> None:
     responses.add(responses.GET, url=url, body=BASE_XML % "456")
 
     # Call without product_version in options, should take it from repo.product_version
-    ret = rp.get_max_revision(repos, arch, project)
+    ret = max_revision(repos, arch, project)
     assert ret == 456
     mock_compute_url.assert_called_with(ANY, "SLES", arch, project="SLFO")
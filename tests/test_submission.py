@@ -18,7 +18,7 @@ from openqabot.types.types import ArchVer, Repos
 from .fixtures.submissions import MockSubmission
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
 
     from pytest_mock import MockerFixture
 
@@ -45,12 +45,13 @@ test_data = {
 }
 
 
+def fake_max_revisions(rev: int) -> Callable[..., dict[ArchVer, int]]:
+    return lambda repos_by_archver, *_args, **_kwargs: dict.fromkeys(repos_by_archver, rev)
+
+
 @pytest.fixture
 def mock_good(mocker: MockerFixture) -> Generator[None]:
-    def fake(*_args: Any, **_kwargs: Any) -> int:
-        return 12345
-
-    return mocker.patch("openqabot.types.submission.get_max_revision", side_effect=fake)
+    return mocker.patch("openqabot.types.submission.get_max_revisions", side_effect=fake_max_revisions(12345))
 
 
 @pytest.fixture
@@ -58,7 +59,7 @@ def mock_ex(mocker: MockerFixture) -> Generator[None]:
     def fake(*_args: Any, **_kwargs: Any) -> NoReturn:
         raise NoRepoFoundError
 
-    return mocker.patch("openqabot.types.submission.get_max_revision", side_effect=fake)
+    return mocker.patch("openqabot.types.submission.get_max_revisions", side_effect=fake)
 
 
 @pytest.mark.usefixtures("mock_good")
@@ -87,6 +88,8 @@ def test_sub_normal() -> None:
     ]
     assert sub.contains_package(["foo", "bar", "some"])
     assert not sub.contains_package(["foo", "bar"])
+    sub.packages = ["foo"]
+    assert not sub.contains_package(["foo", "bar"]), "result is remembered per required packages"
 
 
 @pytest.mark.usefixtures("mock_good")
@@ -127,6 +130,7 @@ def test_sub_nochannels2() -> None:
         "SUSE:SLE-15-SP4:Update",
         "SUSE:Updates:SLE-Module-Development-Tools-OBS:15-SP4:x86_64",
         "SUSE:Updates:SLE-Module-SUSE-Manager-Server:15-SP4:aarch64",
+        "SUSE:Updates:SLES",
     ]
     with pytest.raises(EmptyChannelsError):
         Submission(bad_data)
@@ -204,16 +208,16 @@ def test_sub_rev_multiple_repos(mocker: MockerFixture) -> None:
     data: Any = deepcopy(test_data)
     data["channels"].append("SUSE:Updates:SLE-Module-Basesystem:15-SP4:x86_64")
     sub = Submission(data)
-    mock_get_max = mocker.patch("openqabot.types.submission.get_max_revision", return_value=123)
+    mock_get_max = mocker.patch("openqabot.types.submission.get_max_revisions", side_effect=fake_max_revisions(123))
     sub.compute_revisions_for_product_repo(None, None)
-    # verify get_max_revision was called with both repos for x86_64
-    args = mock_get_max.call_args_list[0][0]
-    assert len(args[0]) == 2
+    # verify both repos for x86_64 were checked together
+    repos_by_archver = mock_get_max.call_args[0][0]
+    assert len(repos_by_archver[ArchVer("x86_64", "15-SP4")]) == 2
 
 
 def test_sub_rev_no_repo_found(mocker: MockerFixture) -> None:
     sub = Submission(test_data)
-    mocker.patch("openqabot.types.submission.get_max_revision", return_value=0)
+    mocker.patch("openqabot.types.submission.get_max_revisions", side_effect=fake_max_revisions(0))
     assert not sub.compute_revisions_for_product_repo(None, None)
 
 
@@ -231,19 +235,44 @@ def test_sub_is_livepatch_false() -> None:
     assert not sub.livepatch
 
 
+def test_channels_set_follows_channels() -> None:
+    sub = Submission(test_data)
+    assert sub.channels_set == frozenset(sub.channels)
+    sub.channels = [Repos("SLES", "15-SP4", "x86_64")]
+    assert sub.channels_set == {Repos("SLES", "15-SP4", "x86_64")}
+
+
+def test_update_channels_parsed_once() -> None:
+    first, second = Submission(test_data), Submission(test_data)
+    assert first.channels == second.channels
+    assert all(a is b for a, b in zip(first.channels, second.channels, strict=True))
+
+
+@pytest.mark.parametrize(
+    ("packages", "expected"),
+    [
+        (["kgraft-patch-SLE15", "foo"], True),
+        (["kernel-livepatch-5_14", "kernel-source"], False),
+        (["foo", "bar"], False),
+    ],
+)
+def test_is_livepatch(packages: list[str], *, expected: bool) -> None:
+    assert Submission.is_livepatch(packages) is expected
+
+
 def test_sub_rev_product_repo_list(mocker: MockerFixture) -> None:
     sub = Submission(test_data)
-    mock_get_max = mocker.patch("openqabot.types.submission.get_max_revision", return_value=123)
+    mock_get_max = mocker.patch("openqabot.types.submission.get_max_revisions", side_effect=fake_max_revisions(123))
     sub.compute_revisions_for_product_repo(["repo1", "repo2"], None)
-    # options is the 4th positional argument (index 3)
-    assert mock_get_max.call_args[0][3].product_name == "repo2"
+    # options is the 3rd positional argument (index 2)
+    assert mock_get_max.call_args[0][2].product_name == "repo2"
 
 
 def test_sub_rev_non_matching_version(mocker: MockerFixture) -> None:
     data = deepcopy(test_data)
     data["channels"] = ["SUSE:Updates:Product:unknown:x86_64"]
     sub = Submission(data)
-    mocker.patch("openqabot.types.submission.get_max_revision", return_value=123)
+    mocker.patch("openqabot.types.submission.get_max_revisions", side_effect=fake_max_revisions(123))
     sub.compute_revisions_for_product_repo(None, None)
     assert sub.revisions is not None
     assert ArchVer("x86_64", "unknown") in sub.revisions
@@ -368,12 +397,12 @@ def test_sub_rev_limit_archs(mocker: MockerFixture) -> None:
         "SUSE:Updates:SLE-Module-Public-Cloud:15-SP4:aarch64",
     ]
     sub = Submission(data)
-    mock_get_max = mocker.patch("openqabot.types.submission.get_max_revision", return_value=123)
+    mock_get_max = mocker.patch("openqabot.types.submission.get_max_revisions", side_effect=fake_max_revisions(123))
     # limit_archs only includes x86_64, aarch64 should be skipped
     sub.compute_revisions_for_product_repo(None, None, limit_archs={"x86_64"})
-    # verify get_max_revision was called only once (for x86_64)
+    # verify only x86_64 was checked
     assert mock_get_max.call_count == 1
-    assert mock_get_max.call_args[0][1] == "x86_64"
+    assert list(mock_get_max.call_args[0][0]) == [ArchVer("x86_64", "15-SP4")]
 
 
 def test_log_skipped_twice(caplog: pytest.LogCaptureFixture) -> None:
@@ -401,15 +430,15 @@ def test_rev_filtering_non_sensible_combinations(mocker: MockerFixture) -> None:
     ]
     sub = Submission(data)
 
-    mock_get_max = mocker.patch("openqabot.types.submission.get_max_revision", return_value=123)
+    mock_get_max = mocker.patch("openqabot.types.submission.get_max_revisions", side_effect=fake_max_revisions(123))
     mocker.patch("openqabot.loader.gitea.get_product_name", side_effect=lambda p: "SLES" if "SLES" in p else "SL-Micro")
 
     # If we request SLES 16.0, SL-Micro 6.2 should be filtered out
     assert sub.compute_revisions_for_product_repo("SLES", "16.0")
-    # Should be called once for SLES
+    # Should only check SLES
     assert mock_get_max.call_count == 1
-    # Check that lrepos passed to get_max_revision only contains SLES
-    lrepos = mock_get_max.call_args[0][0]
+    # Check that lrepos passed to get_max_revisions only contains SLES
+    [lrepos] = mock_get_max.call_args[0][0].values()
     assert len(lrepos) == 1
     assert "SLES" in lrepos[0][1]
 
@@ -420,7 +449,7 @@ def test_rev_filtering_non_sensible_combinations(mocker: MockerFixture) -> None:
     # If we request SL-Micro 6.2, SLES 16.0 should be filtered out
     assert sub2.compute_revisions_for_product_repo("SL-Micro", "6.2")
     assert mock_get_max.call_count == 1
-    lrepos = mock_get_max.call_args[0][0]
+    [lrepos] = mock_get_max.call_args[0][0].values()
     assert len(lrepos) == 1
     assert "SL-Micro" in lrepos[0][1]
 
@@ -433,7 +462,7 @@ def test_rev_filtering_slfo_no_compatible_repos(mocker: MockerFixture) -> None:
     ]
     sub = Submission(data)
 
-    mocker.patch("openqabot.types.submission.get_max_revision", return_value=123)
+    mocker.patch("openqabot.types.submission.get_max_revisions", side_effect=fake_max_revisions(123))
     # Requested product is SL-Micro, which doesn't start with SLES
     mocker.patch("openqabot.loader.gitea.get_product_name", return_value="SLES")
 
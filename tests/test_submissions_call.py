@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from unittest.mock import ANY
 
 import pytest
 
@@ -19,6 +20,8 @@ if TYPE_CHECKING:
 
     from pytest_mock import MockerFixture
 
+    from openqabot.types.submission import Submission
+
 
 def test_submissions_call() -> None:
     """Test for the bare minimal set of arguments needed by the callable."""
@@ -314,6 +317,75 @@ def test_submissions_call_with_params_expand_isolated() -> None:
     assert res[1]["openqa"]["SOMETHING"] == "original"
 
 
+@pytest.mark.parametrize(("ignore_onetime", "fetched"), [(False, [2]), (True, [])])
+def test_submissions_call_prefetches_scheduled_jobs(
+    mocker: MockerFixture, *, ignore_onetime: bool, fetched: list[int]
+) -> None:
+    issues = {"OS_TEST_ISSUES": "SLES:15-SP3"}
+    test_config = {"FLAVOR": {"AAA": {"archs": ["x86_64", "aarch64"], "issues": issues, "excluded_packages": ["bad"]}}}
+    sub_obj = Submissions(
+        JobConfig(
+            product="SLES",
+            product_repo=None,
+            product_version=None,
+            settings={"VERSION": "15-SP3", "DISTRI": "SLES"},
+            config=test_config,
+        ),
+        extrasettings=set(),
+    )
+    get_jobs = mocker.patch.object(Submissions, "_get_scheduled_jobs", return_value=[])
+    match = mocker.spy(sub_obj, "_match_issues")
+    channels = [Repos("SLES", "15-SP3", "x86_64")]
+    submissions: list[Submission] = [
+        MockSubmission(id=1, channels=channels, ongoing=False),
+        MockSubmission(id=2, channels=channels),
+        MockSubmission(id=3),
+        MockSubmission(id=4, channels=channels, packages=["bad-pkg"]),
+    ]
+    sub_obj(submissions=submissions, ci_url="", ignore_onetime=ignore_onetime)
+    assert [c.args[0] for c in get_jobs.call_args_list] == fetched
+    assert match.call_count == 6
+
+
+def test_prefetch_scheduled_jobs_raises_worker_errors(mocker: MockerFixture) -> None:
+    mocker.patch.object(Submissions, "_get_scheduled_jobs", side_effect=ValueError("boom"))
+    with pytest.raises(ValueError, match="boom"):
+        Submissions._prefetch_scheduled_jobs([MockSubmission(id=1)])  # noqa: SLF001
+
+
+@pytest.mark.parametrize(
+    ("flavor", "expected", "embargo_logs"),
+    [
+        ("AAA", [2, 3, 2, 3], 0),
+        ("Azure", [3, 3], 1),
+    ],
+)
+def test_submissions_call_filters_before_archs(
+    mocker: MockerFixture, caplog: pytest.LogCaptureFixture, flavor: str, expected: list[int], embargo_logs: int
+) -> None:
+    test_config = {"FLAVOR": {flavor: {"archs": ["x86_64", "aarch64"], "issues": {}}}}
+    sub_obj = Submissions(
+        JobConfig(
+            product="SLES",
+            product_repo=None,
+            product_version=None,
+            settings={"VERSION": "15-SP3", "DISTRI": "SLES"},
+            config=test_config,
+        ),
+        extrasettings=set(),
+    )
+    process = mocker.patch.object(Submissions, "process_sub_context", return_value=None)
+    submissions: list[Submission] = [
+        MockSubmission(id=1, staging=True),
+        MockSubmission(id=2, embargoed=True),
+        MockSubmission(id=3),
+    ]
+    caplog.set_level("INFO")
+    sub_obj(submissions=submissions, ci_url="", ignore_onetime=True)
+    assert [c.args[0].sub.id for c in process.call_args_list] == expected
+    assert caplog.text.count("Embargoed and embargo-filtering enabled") == embargo_logs
+
+
 class LimitArchsSubmission(MockSubmission):
     """A mock submission that produces different revisions depending on limit_archs."""
 
@@ -322,6 +394,8 @@ class LimitArchsSubmission(MockSubmission):
         product_repo: list[str] | str | None,  # noqa: ARG002
         product_version: str | None,  # noqa: ARG002
         limit_archs: set[str] | None = None,
+        *,
+        concurrent: bool = True,  # noqa: ARG002
     ) -> bool:
         """Mock compute_revisions_for_product_repo."""
         self.revisions = {ArchVer("x86_64", "15-SP3"): 9999} if limit_archs else {ArchVer("x86_64", "15-SP3"): 12345}
@@ -353,3 +427,13 @@ def test_submissions_call_reproduction_of_repeated_schedule(mocker: MockerFixtur
     mocker.patch("openqabot.types.submissions.retried_requests.get").return_value.json.return_value = mock_jobs
     res = sub_obj(submissions=[sub], ci_url="", ignore_onetime=False)
     assert res == []
+
+
+def test_submissions_call_computes_revisions_serially_per_worker(mocker: MockerFixture) -> None:
+    sub_obj = Submissions(
+        JobConfig(product="", product_repo="repo", product_version="ver", settings={}, config={"FLAVOR": {}}),
+        extrasettings=set(),
+    )
+    compute = mocker.spy(MockSubmission, "compute_revisions_for_product_repo")
+    sub_obj(submissions=[MockSubmission(id=1)], ci_url="", ignore_onetime=True)
+    compute.assert_called_once_with(ANY, "repo", "ver", concurrent=False)
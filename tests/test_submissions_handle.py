@@ -8,6 +8,7 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 import pytest
+import requests
 
 from openqabot.config import DEFAULT_SUBMISSION_TYPE
 from openqabot.errors import NoRepoFoundError
@@ -126,13 +127,26 @@ def test_handle_submission_with_ci_url(mocker: MockerFixture) -> None:
     ctx = SubContext(sub=sub, arch="x86_64", flavor="AAA", data=submissions_obj.flavors["AAA"])
     cfg = SubConfig(ci_url="http://my-ci.com/123", ignore_onetime=True)
 
-    mocker.patch("openqabot.types.submission.get_max_revision", return_value=123)
+    mocker.patch(
+        "openqabot.types.submission.get_max_revisions", side_effect=lambda repos, *_, **__: dict.fromkeys(repos, 123)
+    )
     result = submissions_obj.handle_submission(ctx, cfg)
 
     assert result is not None
     assert result["openqa"]["__CI_JOB_URL"] == "http://my-ci.com/123"
 
 
+def test_get_base_settings_shares_flavor_settings() -> None:
+    submissions_obj = _get_submissions_obj()
+    cfg = SubConfig(ci_url=None, ignore_onetime=True)
+    ctx = SubContext(MockSubmission(id=1), "x86_64", "AAA", {"versioned_by_submission": True})
+    first = submissions_obj.get_base_settings(ctx, 1, cfg)
+    second = submissions_obj.get_base_settings(ctx._replace(sub=MockSubmission(id=2), data={}), 2, cfg)
+    assert (first["INCIDENT_ID"], first["REPOHASH"], first["VERSION"]) == (1, 1, "15-SP3:smelt-1")
+    assert (second["INCIDENT_ID"], second["REPOHASH"], second["VERSION"]) == (2, 2, "15-SP3")
+    assert second["_OBSOLETE"] == "1"
+
+
 def test_is_scheduled_job_error(mocker: MockerFixture) -> None:
     sub = MockSubmission()
     sub.id = 1
@@ -141,6 +155,38 @@ def test_is_scheduled_job_error(mocker: MockerFixture) -> None:
     assert not Submissions.is_scheduled_job(ctx, "ver")
 
 
+def test_match_issues() -> None:
+    issues = {
+        "SLFO_TEST_ISSUES": "SLFO:1.1.99#15.99",
+        "OS_TEST_ISSUES": "SLES:15-SP3",
+        "BASE_TEST_ISSUES": "SLES:15-SP3",
+        "OTHER_TEST_ISSUES": "SLFO:1.2#16.0",
+    }
+    submissions_obj = _get_submissions_obj({"FLAVOR": {"AAA": {"archs": ["x86_64"], "issues": issues}}})
+    sles = Repos("SLES", "15-SP3", "x86_64")
+    slfo = Repos("SUSE:SLFO", "1.1.99:PullRequest:1", "x86_64", "15.99")
+    sub = MockSubmission(channels=[sles, slfo, sles._replace(arch="aarch64")])
+    ctx = SubContext(sub, "x86_64", "AAA", submissions_obj.flavors["AAA"])
+    expected = {"SLFO_TEST_ISSUES": [slfo], "OS_TEST_ISSUES": [sles], "BASE_TEST_ISSUES": [sles]}
+    assert submissions_obj._match_issues(ctx) == expected  # noqa: SLF001
+    assert list(submissions_obj._match_issues(ctx)) == list(expected)  # noqa: SLF001
+    assert submissions_obj._match_issues(ctx._replace(data={})) == {}  # noqa: SLF001
+
+
+def test_is_scheduled_job_cached(mocker: MockerFixture) -> None:
+    sub = MockSubmission()
+    sub.id = 1
+    mocker.patch.object(sub, "revisions_with_fallback", return_value=42)
+    job = {"flavor": "flavor", "arch": "arch", "version": "ver", "settings": {"REPOHASH": 42}}
+    get = mocker.patch("openqabot.types.submissions.retried_requests.get")
+    get.side_effect = [requests.ConnectionError, mocker.Mock(**{"json.return_value": [job]})]
+    ctx = SubContext(sub, "arch", "flavor", {})
+    assert not Submissions.is_scheduled_job(ctx, "ver")
+    assert Submissions.is_scheduled_job(ctx, "ver")
+    assert not Submissions.is_scheduled_job(ctx._replace(arch="other"), "ver")
+    assert get.call_count == 2
+
+
 def test_is_scheduled_job_no_revs(mocker: MockerFixture) -> None:
     sub = MockSubmission()
     sub.id = 1
@@ -44,6 +44,11 @@ def test_prodver_from_issue_channel_without_product_version() -> None:
     assert not pv.product_version
 
 
+def test_prodver_from_issue_channel_shared() -> None:
+    """Repeated channel strings share one parsed ProdVer."""
+    assert ProdVer.from_issue_channel("SLES:15-SP3") is ProdVer.from_issue_channel("SLES:15-SP3")
+
+
 def test_prodver_from_issue_channel_type() -> None:
     """Channel type can be derived from factory-created ProdVer."""
     assert get_channel_type(ProdVer.from_issue_channel("SLFO:x#1").product) == ChannelType.SLFO
@@ -51,6 +56,13 @@ def test_prodver_from_issue_channel_type() -> None:
     assert get_channel_type(ProdVer.from_issue_channel("openSUSE-SLE:15.4").product) == ChannelType.OPENSUSE
 
 
+def test_repos_compute_url_cached() -> None:
+    """Equal repos share the computed URL."""
+    url = Repos("SLES", "15-SP3", "x86_64").compute_url("http://base")
+    assert url == "http://base/SUSE_Updates_SLES_15-SP3_x86_64/repodata/repomd.xml"
+    assert Repos("SLES", "15-SP3", "x86_64").compute_url("http://base") is url
+
+
 def test_repos_compute_url_slfo_via_project_param() -> None:
     """project='SLFO' triggers SLFO URL path regardless of product string."""
     repo = Repos("SomeProduct", "1.2", "x86_64")
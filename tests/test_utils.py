@@ -9,11 +9,13 @@ from typing import TYPE_CHECKING, Any
 
 import pytest
 import responses
+from requests.adapters import HTTPAdapter
 from responses import registries
 
 from openqabot.loader.config import get_yml_list
 from openqabot.types.types import Data
 from openqabot.utils import (
+    LazyPformat,
     compare_submission_data,
     create_logger,
     extract_contact_from_description,
@@ -27,6 +29,14 @@ if TYPE_CHECKING:
     from pytest_mock import MockerFixture
 
 
+def test_lazy_pformat(mocker: MockerFixture) -> None:
+    pformat = mocker.patch("openqabot.utils.pformat", return_value="pretty")
+    lazy = LazyPformat({"a": 1})
+    pformat.assert_not_called()
+    assert str(lazy) == "pretty"
+    pformat.assert_called_once_with({"a": 1})
+
+
 def test_compare_submission_data() -> None:
     sub = Data(1, "type", 1, "flavor", "arch", "distri", "version", "build", "product")
     assert compare_submission_data(sub, {"BUILD": "build"}) is True
@@ -127,6 +137,9 @@ def test_make_retry_session(mocker: MockerFixture) -> None:
     req = retry3.get("http://host.some")
     assert req.status_code == 404
     assert rsp4.call_count == 1
+    adapter = retry3.get_adapter("https://host.some")
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 64
 
 
 def test_get_yml_list_single_file_yml(tmp_path: Path) -> None:
@@ -174,6 +187,12 @@ def test_get_yml_list_folder_with_multiple_files(tmp_path: Path) -> None:
     assert len(res) == 10
 
 
+def test_get_yml_list_skips_directories(tmp_path: Path) -> None:
+    (tmp_path / "nested.yml").mkdir()
+    (tmp_path / "hello.yaml").write_text("")
+    assert get_yml_list(tmp_path) == [tmp_path / "hello.yaml"]
+
+
 def test_unique_dicts() -> None:
     """Test unique_dicts with and without duplicates."""
     data = [{"a": "1", "b": "2"}, {"b": "2", "a": "1"}, {"c": "3"}]
@@ -7,6 +7,8 @@ from pathlib import Path
 from typing import Any
 
 import pytest
+import yaml
+from pytest_mock import MockerFixture
 
 from openqabot.loader.config import get_configs_from_path
 
@@ -43,6 +45,17 @@ trigger_config:
     assert distris == {"sle", "opensuse"}
 
 
+def test_get_configs_from_path_parses_once(tmp_path: Path, mocker: MockerFixture) -> None:
+    config_file = tmp_path / "config.yml"
+    config_file.write_text("trigger_config:\n  - distri: sle\n")
+    load = mocker.spy(yaml, "load")
+
+    for _ in range(2):
+        configs = get_configs_from_path(config_file, "trigger_config", MockConfig.from_config_entry)
+        assert [c.distri for c in configs] == ["sle"]
+    load.assert_called_once()
+
+
 def test_get_configs_from_path_list(tmp_path: Path) -> None:
     """Test loading configurations from a list-style YAML."""
     config_file = tmp_path / "config.yml"